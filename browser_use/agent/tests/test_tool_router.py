@@ -0,0 +1,167 @@
+"""
+Tests for the tool router: its LLM-free shortcuts and the routing cache.
+
+The routing LLM is a stub that records calls and fails, so a test can tell
+whether a query was settled by heuristics or handed to the LLM.
+"""
+
+import pytest
+
+from browser_use.agent.tool_router import ToolDecision, ToolType, _RoutingCache, route_query
+from browser_use.llm.exceptions import ModelProviderError
+
+
+class FailingLLM:
+	"""Routing LLM stub: counts calls and raises like an unreachable provider"""
+
+	model = 'stub'
+
+	def __init__(self):
+		self.calls = 0
+
+	async def ainvoke(self, messages, output_format=None):
+		self.calls += 1
+		raise ModelProviderError('stub LLM called')
+
+
+def _decision(query: str, tool: ToolType) -> ToolDecision:
+	return ToolDecision(
+		primary_tool=tool,
+		secondary_tools=(),
+		reasoning=f'{tool.value} for: {query}',
+		specific_actions=(query,),
+		original_query=query,
+	)
+
+
+@pytest.mark.parametrize(
+	'query',
+	[
+		'hello there',
+		'thank you so much',
+		'calculate 17 * 23',
+	],
+)
+async def test_plain_chat_skips_llm(query):
+	llm = FailingLLM()
+	decision = await route_query(llm, query)
+	assert decision.primary_tool == ToolType.CHAT
+	assert llm.calls == 0
+
+
+@pytest.mark.parametrize(
+	'query, tool',
+	[
+		('check my inbox', ToolType.EMAIL),
+		('add a row to my spreadsheet', ToolType.SHEETS),
+		('book an appointment with the dentist', ToolType.CALENDAR),
+		('open the website example.com', ToolType.BROWSER),
+	],
+)
+async def test_single_confident_keyword_skips_llm(query, tool):
+	llm = FailingLLM()
+	decision = await route_query(llm, query)
+	assert decision.primary_tool == tool
+	assert llm.calls == 0
+
+
+@pytest.mark.parametrize(
+	'query',
+	[
+		# Chat phrasing together with a tool keyword
+		'when is my next meeting',
+		'what is the price of bitcoin',
+		'what is the latest news',
+		'hi, how are you today?',
+		'explain what an event loop is',
+		# Confident keyword inside a question
+		'what is a spreadsheet',
+		'how do I write a good email',
+		'explain how gmail filters work',
+		'tell me about the history of the calendar',
+		# Keywords for more than one tool
+		'email the calendar invite to bob',
+		'check my inbox for news',
+		# Broad keywords only
+		'how do I make a table in markdown?',
+		'what is a cell in biology',
+	],
+)
+async def test_ambiguous_queries_go_to_llm(query):
+	llm = FailingLLM()
+	await route_query(llm, query)
+	assert llm.calls == 1
+
+
+async def test_forced_tool_skips_llm():
+	llm = FailingLLM()
+	decision = await route_query(llm, 'what is a spreadsheet', force_tool=ToolType.BROWSER)
+	assert decision.primary_tool == ToolType.BROWSER
+	assert llm.calls == 0
+
+
+@pytest.mark.parametrize('payload', ['[]', 'null', '"routes"', '{"check my email": []}', '{"check my email": null}'])
+def test_routing_cache_load_ignores_malformed_file(tmp_path, payload):
+	path = tmp_path / 'routes.json'
+	path.write_text(payload)
+	cache = _RoutingCache()
+	cache.load(path)
+	assert cache.get('check my email') is None
+
+
+def test_routing_cache_save_load_round_trip(tmp_path):
+	path = tmp_path / 'routes.json'
+	cache = _RoutingCache()
+	cache.put('check my email', _decision('check my email', ToolType.EMAIL))
+	cache.save(path)
+
+	loaded = _RoutingCache()
+	loaded.load(path)
+	assert loaded.get('check my email').primary_tool == ToolType.EMAIL
+
+
+def test_routing_cache_exact_hit_ignores_case_and_spacing():
+	cache = _RoutingCache()
+	cache.put('Check my email', _decision('Check my email', ToolType.EMAIL))
+
+	hit = cache.get('  check   MY email ')
+	assert hit.primary_tool == ToolType.EMAIL
+	assert hit.specific_actions == ('Check my email',)
+	assert hit.original_query == '  check   MY email '
+
+
+def test_routing_cache_similar_hit_keeps_only_the_tool():
+	stored = 'please search flights from new york to london tomorrow on kayak'
+	query = 'please search flights from new york to paris tomorrow on kayak'
+	cache = _RoutingCache(threshold=0.8)
+	cache.put(stored, _decision(stored, ToolType.BROWSER))
+
+	hit = cache.get(query)
+	assert hit.primary_tool == ToolType.BROWSER
+	assert hit.specific_actions == (query,)
+	assert hit.original_query == query
+	assert hit.reasoning.startswith('Cached routing')
+
+
+def test_routing_cache_similarity_below_threshold_misses():
+	cache = _RoutingCache()
+	cache.put('check my email', _decision('check my email', ToolType.EMAIL))
+	assert cache.get('what is the weather in paris') is None
+
+
+def test_routing_cache_evicts_least_recently_used():
+	cache = _RoutingCache(maxsize=2)
+	cache.put('alpha query', _decision('alpha query', ToolType.CHAT))
+	cache.put('beta query', _decision('beta query', ToolType.CHAT))
+	cache.get('alpha query')  # alpha becomes most recently used
+	cache.put('gamma query', _decision('gamma query', ToolType.CHAT))
+
+	assert cache.get('alpha query') is not None
+	assert cache.get('gamma query') is not None
+	assert cache.get('beta query') is None
+
+
+def test_routing_cache_drops_expired_entries():
+	cache = _RoutingCache(ttl=60)
+	cache.put('check my email', _decision('check my email', ToolType.EMAIL), stored_at=0)
+	assert cache.get('check my email') is None
@@ -3,14 +3,23 @@ Tool Router for Browser-Use Agent
 Intelligently routes user queries to appropriate tools (chat, browser, calendar, email)
 """
 
+import asyncio
+import functools
 import json
+import math
 import re
+import time
+from collections import Counter, OrderedDict
 from enum import Enum
-from typing import Optional, List
-from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal, Optional, List
+from dataclasses import dataclass, replace
+
+from pydantic import BaseModel, Field
 
 from browser_use.llm.base import BaseChatModel
-from browser_use.llm.messages import UserMessage
+from browser_use.llm.exceptions import ModelProviderError
+from browser_use.llm.messages import SystemMessage, UserMessage
 
 
 class ToolType(Enum):
@@ -22,18 +31,274 @@ class ToolType(Enum):
 	SHEETS = "sheets"
 
 
-@dataclass
+# Tool names in the casings LLMs and users commonly produce, for O(1) lookup
+_STR_TO_TOOLTYPE: dict[str, ToolType] = {
+	name: tool for tool in ToolType for name in (tool.value, tool.value.upper(), tool.value.capitalize())
+}
+
+
+def tool_type_from_str(name: str) -> ToolType:
+	"""
+	Resolve a tool name ('email', 'EMAIL', 'Email', ...) to its ToolType
+
+	Raises:
+		ValueError: If name is not a known tool
+	"""
+	tool = _STR_TO_TOOLTYPE.get(name)
+	if tool is None:
+		# Unusual casing; ToolType raises ValueError for unknown names
+		tool = ToolType(name.lower())
+	return tool
+
+
+@dataclass(frozen=True, slots=True)
 class ToolDecision:
 	"""Decision about which tool(s) to use"""
 	primary_tool: ToolType
-	secondary_tools: List[ToolType]
+	secondary_tools: tuple[ToolType, ...]
 	reasoning: str
-	specific_actions: List[str]
+	specific_actions: tuple[str, ...]
 	original_query: str
 
 
-# Tool routing prompt for LLM
-TOOL_ROUTING_PROMPT = """You are an intelligent tool router for an AI assistant with multiple capabilities.
+ToolName = Literal['chat', 'browser', 'calendar', 'email', 'sheets']
+
+
+class ToolDecisionSchema(BaseModel):
+	"""Structured output the routing LLM must return"""
+	primary_tool: ToolName
+	secondary_tools: list[ToolName] = Field(default_factory=list)
+	reasoning: str = ''
+	specific_actions: list[str] = Field(default_factory=list)
+
+
+class BatchToolDecisionSchema(BaseModel):
+	"""Structured output for a batched routing call, one decision per query"""
+	decisions: list[ToolDecisionSchema]
+
+
+# Heuristic patterns, compiled once at import time
+_CHAT_PATTERNS = [
+	re.compile(pattern)
+	for pattern in (
+		r'^(what|who|when|where|why|how|explain|tell me|can you)\s+(is|are|was|were|do|does)',
+		r'^(calculate|compute|solve|what\'?s?\s+\d+)',  # Math questions
+		r'^(hello|hi|hey|thanks|thank you|goodbye|bye)',  # Greetings
+		r'^(tell me about|explain|describe|define)',  # Explanations
+	)
+]
+
+# Substrings that mean the user wants a web search rather than a chat answer
+_WEB_INDICATORS = frozenset(['search', 'find online', 'look up', 'browse', 'website', 'google'])
+
+# Keyword sets per tool, in fallback priority order
+_EMAIL_KEYWORDS = ('email', 'mail', 'inbox', 'send message', 'unread')
+_SHEETS_KEYWORDS = ('spreadsheet', 'sheet', 'excel', 'table', 'row', 'column', 'cell')
+_CALENDAR_KEYWORDS = ('calendar', 'calender', 'schedule', 'meeting', 'appointment', 'event', 'planned', 'tomorrow', 'today')
+_BROWSER_KEYWORDS = ('search', 'find', 'look up', 'browse', 'website', 'google', 'price', 'weather', 'news')
+
+# Tool keyword categories, in fallback priority order
+_KEYWORD_CATEGORIES = (
+	(ToolType.EMAIL, _EMAIL_KEYWORDS),
+	(ToolType.SHEETS, _SHEETS_KEYWORDS),
+	(ToolType.CALENDAR, _CALENDAR_KEYWORDS),
+	(ToolType.BROWSER, _BROWSER_KEYWORDS),
+)
+
+
+def _keyword_alternation(categories) -> str:
+	"""Build one alternation with a named group per category, so a single scan reports every category hit"""
+	return '|'.join(
+		f'(?P<{name}>' + '|'.join(re.escape(word) for word in words) + ')'
+		for name, words in categories
+	)
+
+
+_TOOL_KEYWORD_ALTERNATION = _keyword_alternation((tool.value, keywords) for tool, keywords in _KEYWORD_CATEGORIES)
+
+# Substring hits anywhere in the query (zero-width lookahead, so every offset is tried)
+_TOOL_KEYWORD_RE = re.compile(f'(?=(?:{_TOOL_KEYWORD_ALTERNATION}))')
+
+# Keywords specific enough to pick a tool without the LLM ("today", "table", "news" are not)
+_CONFIDENT_KEYWORD_CATEGORIES = (
+	(ToolType.EMAIL, ('email', 'gmail', 'inbox', 'unread')),
+	(ToolType.SHEETS, ('spreadsheet', 'google sheets')),
+	(ToolType.CALENDAR, ('calendar', 'calender', 'appointment')),
+	(ToolType.BROWSER, ('website', 'web page', 'webpage')),
+)
+
+# Whole-word hits (plural allowed) for confident routing, so "emailing" is not "email"
+_CONFIDENT_KEYWORD_RE = re.compile(
+	rf'\b(?:{_keyword_alternation((tool.value, keywords) for tool, keywords in _CONFIDENT_KEYWORD_CATEGORIES)})s?\b'
+)
+
+# Keywords that hint at a chained, multi-tool request, scanned in one pass
+_MULTI_TOOL_RE = re.compile(
+	r'(?P<calendar>calendar|schedule|meeting)'
+	r'|(?P<email>email|send\s+message)'
+	r'|(?P<browser>search|find|look\s+up|browse|check\s+online)'
+	r'|(?P<conj>\b(?:and|then|after|followed\s+by)\b)'
+)
+
+
+def _keyword_hits(pattern: re.Pattern, text: str) -> set[str]:
+	"""Names of the keyword categories found in text, in one pass"""
+	return {match.lastgroup for match in pattern.finditer(text)}
+
+
+# Word tokens used to compare queries in the routing cache
+_CACHE_TOKEN_RE = re.compile(r"[a-z0-9@.']+")
+
+# Politeness filler that does not change which tool a query needs
+_CACHE_FILLER_WORDS = frozenset(['please', 'can', 'could', 'would', 'you', 'kindly', 'hey'])
+
+
+class _RoutingCache:
+	"""
+	LRU cache of LLM routing decisions
+
+	Two lookup tiers:
+	- Exact: normalized query text → decision (single dict probe)
+	- Similar: cosine similarity of bag-of-words vectors against stored queries,
+	  so rephrasings like "check my email" / "can you check my email please" reuse
+	  the same decision
+
+	Entries expire after ttl seconds and can be saved to / loaded from a JSON file
+	so decisions carry over between sessions.
+	"""
+
+	def __init__(self, maxsize: int = 256, threshold: float = 0.9, ttl: float = 7 * 24 * 3600):
+		self.maxsize = maxsize
+		self.threshold = threshold
+		self.ttl = ttl
+		self._entries: OrderedDict[str, tuple[Counter, float, ToolDecision, float]] = OrderedDict()
+
+	@staticmethod
+	def _normalize(query: str) -> str:
+		return ' '.join(query.strip().lower().split())
+
+	@staticmethod
+	def _vectorize(key: str) -> tuple[Counter, float]:
+		vector = Counter(token for token in _CACHE_TOKEN_RE.findall(key) if token not in _CACHE_FILLER_WORDS)
+		return vector, math.sqrt(sum(count * count for count in vector.values()))
+
+	def _evict_expired(self) -> None:
+		cutoff = time.time() - self.ttl
+		# Lookups reorder entries without refreshing their timestamp, so check them all (the cache is small)
+		for key in [key for key, entry in self._entries.items() if entry[3] < cutoff]:
+			del self._entries[key]
+
+	def get(self, query: str) -> Optional[ToolDecision]:
+		"""Return a cached decision for this query (or a near-duplicate), if any"""
+		self._evict_expired()
+		key = self._normalize(query)
+
+		entry = self._entries.get(key)
+		if entry is None:
+			vector, norm = self._vectorize(key)
+			if not norm:
+				return None
+
+			best_score = 0.0
+			for stored_key, (stored_vector, stored_norm, _, _) in self._entries.items():
+				dot = sum(count * stored_vector[token] for token, count in vector.items())
+				score = dot / (norm * stored_norm)
+				if score > best_score:
+					best_score, key = score, stored_key
+
+			if best_score < self.threshold:
+				return None
+			self._entries.move_to_end(key)
+			# Only the tool choice carries over; actions and reasoning belonged to the stored query
+			return replace(
+				self._entries[key][2],
+				reasoning=f"Cached routing of similar query: {key}",
+				specific_actions=(query,),
+				original_query=query,
+			)
+
+		self._entries.move_to_end(key)
+		return replace(entry[2], original_query=query)
+
+	def put(self, query: str, decision: ToolDecision, stored_at: Optional[float] = None) -> None:
+		"""Store a routing decision, evicting the least recently used entry when full"""
+		key = self._normalize(query)
+		vector, norm = self._vectorize(key)
+		if not norm:
+			return
+
+		self._entries[key] = (vector, norm, decision, time.time() if stored_at is None else stored_at)
+		self._entries.move_to_end(key)
+		if len(self._entries) > self.maxsize:
+			self._entries.popitem(last=False)
+
+	def clear(self) -> None:
+		self._entries.clear()
+
+	def load(self, path: Path) -> None:
+		"""Add the unexpired decisions saved in path (a missing or unreadable file is ignored)"""
+		try:
+			saved = json.loads(path.read_text())
+		except (OSError, ValueError):
+			return
+		# Valid JSON of the wrong shape (e.g. [] or null from a hand edit) is ignored too
+		if not isinstance(saved, dict):
+			return
+
+		cutoff = time.time() - self.ttl
+		for key, item in saved.items():
+			if not isinstance(item, dict):
+				continue
+			try:
+				if item['ts'] < cutoff:
+					continue
+				tools = [tool_type_from_str(name) for name in item['tools']]
+				decision = ToolDecision(
+					primary_tool=tools[0],
+					secondary_tools=tuple(tools[1:]),
+					reasoning=item['reasoning'],
+					specific_actions=tuple(item['actions']),
+					original_query=key,
+				)
+			except (KeyError, IndexError, TypeError, ValueError):
+				continue
+			self.put(key, decision, stored_at=item['ts'])
+
+	def save(self, path: Path) -> None:
+		"""Write the cached decisions to path as JSON"""
+		self._evict_expired()
+		payload = {
+			key: {
+				'tools': [decision.primary_tool.value, *(tool.value for tool in decision.secondary_tools)],
+				'reasoning': decision.reasoning,
+				'actions': list(decision.specific_actions),
+				'ts': stored_at,
+			}
+			for key, (_, _, decision, stored_at) in self._entries.items()
+		}
+		path.parent.mkdir(parents=True, exist_ok=True)
+		# Write then rename so an interrupted write never leaves a corrupt file
+		tmp_path = path.with_suffix('.tmp')
+		tmp_path.write_text(json.dumps(payload))
+		tmp_path.replace(path)
+
+
+_ROUTING_CACHE = _RoutingCache()
+
+
+def load_routing_cache(path: Path) -> None:
+	"""Seed the routing cache with decisions saved by an earlier session"""
+	_ROUTING_CACHE.load(path)
+
+
+def save_routing_cache(path: Path) -> None:
+	"""Persist the routing cache so the next session can skip repeated routing calls"""
+	_ROUTING_CACHE.save(path)
+
+
+# Static routing instructions, sent as a cacheable system message. Keeping every
+# per-request detail out of it makes it an identical prefix on each routing call.
+_ROUTING_SYSTEM_PREFIX = """You are an intelligent tool router for an AI assistant with multiple capabilities.
 
 Analyze the user's request and determine which tool(s) to use.
 
@@ -80,17 +345,38 @@ CRITICAL ROUTING RULES:
 If uncertain between EMAIL and BROWSER, and query mentions "email/mail/send/message", choose EMAIL.
 If uncertain between SHEETS and BROWSER, and query mentions "spreadsheet/sheet/excel", choose SHEETS.
 
-Analyze this user request: "{user_query}"
+For each request, give the primary tool, any secondary tools, your reasoning,
+and the specific actions to take."""
+
+# Per-request user turns appended after the cached system prefix
+TOOL_ROUTING_PROMPT = 'Analyze this user request: "{user_query}"'
+
+BATCH_ROUTING_PROMPT = """Analyze each of these user requests independently:
+{numbered_queries}
+
+Return exactly one decision per request, in the same order."""
 
-Respond with ONLY valid JSON (no markdown, no extra text):
-{{
-	"primary_tool": "tool_name",
-	"secondary_tools": ["tool1", "tool2"],
-	"reasoning": "why these tools were chosen",
-	"specific_actions": ["action1", "action2"]
-}}"""
 
+# Size of the per-helper memo caches (keyed on the query text)
+_HEURISTIC_CACHE_SIZE = 2048
 
+# Command prefixes (including aliases) mapped to the tool they force
+_PREFIX_TO_TOOL: dict[str, ToolType] = {
+	'/browser': ToolType.BROWSER,
+	'/calendar': ToolType.CALENDAR,
+	'/calender': ToolType.CALENDAR,  # Common misspelling
+	'/email': ToolType.EMAIL,
+	'/mail': ToolType.EMAIL,  # Shorter alias
+	'/sheets': ToolType.SHEETS,
+	'/sheet': ToolType.SHEETS,  # Shorter alias
+	'/chat': ToolType.CHAT,
+}
+
+# A command prefix always ends within this many characters of the query start
+_MAX_PREFIX_LEN = max(map(len, _PREFIX_TO_TOOL))
+
+
+@functools.lru_cache(maxsize=_HEURISTIC_CACHE_SIZE)
 def parse_manual_override(query: str) -> Optional[ToolType]:
 	"""
 	Check if user explicitly specified a tool via command prefix
@@ -104,43 +390,21 @@ def parse_manual_override(query: str) -> Optional[ToolType]:
 
 	Returns None if no override found
 	"""
-	query_lower = query.strip().lower()
-
-	# Check for command prefix
-	if query_lower.startswith('/browser '):
-		return ToolType.BROWSER
-	elif query_lower.startswith('/calendar ') or query_lower.startswith('/calender '):
-		return ToolType.CALENDAR
-	elif query_lower.startswith('/email ') or query_lower.startswith('/mail '):
-		return ToolType.EMAIL
-	elif query_lower.startswith('/sheets ') or query_lower.startswith('/sheet '):
-		return ToolType.SHEETS
-	elif query_lower.startswith('/chat '):
-		return ToolType.CHAT
-
-	return None
+	stripped = query.strip()
+	# Only the first token is examined (and lowercased), never the whole query
+	space = stripped.find(' ', 0, _MAX_PREFIX_LEN + 1)
+	return _PREFIX_TO_TOOL.get(stripped[:space].lower()) if space > 0 else None
 
 
+@functools.lru_cache(maxsize=_HEURISTIC_CACHE_SIZE)
 def strip_command_prefix(query: str) -> str:
 	"""Remove command prefix from query if present"""
-	query_lower = query.strip().lower()
-
-	# Check all supported prefixes (including aliases)
-	prefixes = [
-		'/browser ',
-		'/calendar ',
-		'/calender ',  # Common misspelling
-		'/email ',
-		'/mail ',      # Shorter alias
-		'/sheets ',
-		'/sheet ',     # Shorter alias
-		'/chat '
-	]
+	stripped = query.strip()
+	space = stripped.find(' ', 0, _MAX_PREFIX_LEN + 1)
 
-	for prefix in prefixes:
-		if query_lower.startswith(prefix):
-			# Return original query with prefix removed (preserve case)
-			return query[len(prefix):].strip()
+	if space > 0 and stripped[:space].lower() in _PREFIX_TO_TOOL:
+		# Return original query with prefix removed (preserve case)
+		return stripped[space + 1:].strip()
 
 	return query
 
@@ -150,24 +414,153 @@ def is_pure_chat_query(query: str) -> bool:
 	Heuristic check if query is likely a pure chat interaction
 	Returns True if query seems to be conversational without needing tools
 	"""
-	query_lower = query.strip().lower()
+	return _is_pure_chat(query.strip().lower())
 
-	# Chat indicators
-	chat_patterns = [
-		r'^(what|who|when|where|why|how|explain|tell me|can you)\s+(is|are|was|were|do|does)',
-		r'^(calculate|compute|solve|what\'?s?\s+\d+)',  # Math questions
-		r'^(hello|hi|hey|thanks|thank you|goodbye|bye)',  # Greetings
-		r'^(tell me about|explain|describe|define)',  # Explanations
+
+@functools.lru_cache(maxsize=_HEURISTIC_CACHE_SIZE)
+def _is_chat_form(query_lower: str) -> bool:
+	"""Whether the query reads like conversation or a question ("hi", "what is", "explain", ...)"""
+	return any(pattern.search(query_lower) for pattern in _CHAT_PATTERNS)
+
+
+@functools.lru_cache(maxsize=_HEURISTIC_CACHE_SIZE)
+def _is_pure_chat(query_lower: str) -> bool:
+	if not _is_chat_form(query_lower):
+		return False
+
+	# Check if it's not asking for web search
+	if any(indicator in query_lower for indicator in _WEB_INDICATORS):
+		return False
+
+	# Any tool keyword makes it ambiguous ("when is my next meeting"); the LLM decides those
+	return not _keyword_hits(_TOOL_KEYWORD_RE, query_lower)
+
+
+def confident_keyword_route(query: str) -> Optional[ToolType]:
+	"""
+	Route by keywords alone when the answer is unambiguous
+
+	Returns the tool when it is the only tool named, by an unambiguous keyword
+	(whole word) and with no other tool's keywords present, in a query that is
+	not phrased as a question ("what is a spreadsheet"); None otherwise (the LLM
+	should decide)
+	"""
+	return _confident_keyword_route(query.lower())
+
+
+@functools.lru_cache(maxsize=_HEURISTIC_CACHE_SIZE)
+def _confident_keyword_route(query_lower: str) -> Optional[ToolType]:
+	if _is_chat_form(query_lower):
+		return None
+
+	hits = _keyword_hits(_CONFIDENT_KEYWORD_RE, query_lower)
+	if len(hits) != 1:
+		return None
+	tool = hits.pop()
+
+	# The rest of the query must not point at another tool ("check my inbox for news")
+	other_hits = _keyword_hits(_TOOL_KEYWORD_RE, _CONFIDENT_KEYWORD_RE.sub(' ', query_lower))
+	if other_hits - {tool}:
+		return None
+	return ToolType(tool)
+
+
+def _decision_from_schema(result: ToolDecisionSchema, user_query: str) -> ToolDecision:
+	"""Convert a structured LLM routing result into a ToolDecision"""
+	return ToolDecision(
+		primary_tool=_STR_TO_TOOLTYPE[result.primary_tool],
+		secondary_tools=tuple(_STR_TO_TOOLTYPE[t] for t in result.secondary_tools),
+		reasoning=result.reasoning,
+		specific_actions=tuple(result.specific_actions) or (user_query,),
+		original_query=user_query
+	)
+
+
+def _routing_messages(prompt: str) -> list:
+	"""Static cached system prefix followed by the short per-request user turn"""
+	return [
+		SystemMessage(content=_ROUTING_SYSTEM_PREFIX, cache=True),
+		UserMessage(content=prompt),
 	]
 
-	for pattern in chat_patterns:
-		if re.search(pattern, query_lower):
-			# Check if it's not asking for web search
-			web_indicators = ['search', 'find online', 'look up', 'browse', 'website', 'google']
-			if not any(indicator in query_lower for indicator in web_indicators):
-				return True
 
-	return False
+async def _llm_route(llm: BaseChatModel, user_queries: List[str]) -> List[ToolDecision]:
+	"""Route one or more queries with a single LLM call"""
+	if len(user_queries) == 1:
+		prompt = TOOL_ROUTING_PROMPT.format(user_query=user_queries[0])
+
+		# Structured output guarantees a valid schema instance
+		response = await llm.ainvoke(_routing_messages(prompt), output_format=ToolDecisionSchema)
+		return [_decision_from_schema(response.completion, user_queries[0])]
+
+	numbered_queries = '\n'.join(f'{i}. "{query}"' for i, query in enumerate(user_queries, 1))
+	prompt = BATCH_ROUTING_PROMPT.format(numbered_queries=numbered_queries)
+
+	response = await llm.ainvoke(_routing_messages(prompt), output_format=BatchToolDecisionSchema)
+	results = response.completion.decisions
+	if len(results) != len(user_queries):
+		raise ValueError(f"Batched routing returned {len(results)} decisions for {len(user_queries)} queries")
+
+	return [_decision_from_schema(result, query) for result, query in zip(results, user_queries)]
+
+
+class _RoutingBatcher:
+	"""
+	Coalesces concurrent routing requests for the same LLM into one call
+
+	The first request for an LLM opens a short window; requests arriving before it
+	closes (up to max_batch) are routed together with one batched prompt
+	"""
+
+	def __init__(self, window: float = 0.005, max_batch: int = 8):
+		self.window = window
+		self.max_batch = max_batch
+		self._pending: dict[int, tuple[BaseChatModel, list[tuple[str, asyncio.Future]]]] = {}
+		self._timers: dict[int, asyncio.TimerHandle] = {}
+		self._tasks: set[asyncio.Task] = set()
+
+	async def submit(self, llm: BaseChatModel, user_query: str) -> ToolDecision:
+		"""Queue a query for routing and wait for its decision"""
+		loop = asyncio.get_running_loop()
+		future = loop.create_future()
+
+		key = id(llm)
+		_, batch = self._pending.setdefault(key, (llm, []))
+		batch.append((user_query, future))
+
+		if len(batch) >= self.max_batch:
+			self._flush(key)
+		elif len(batch) == 1:
+			self._timers[key] = loop.call_later(self.window, self._flush, key)
+
+		return await future
+
+	def _flush(self, key: int) -> None:
+		timer = self._timers.pop(key, None)
+		if timer is not None:
+			timer.cancel()
+
+		llm, batch = self._pending.pop(key)
+		task = asyncio.create_task(self._run(llm, batch))
+		self._tasks.add(task)
+		task.add_done_callback(self._tasks.discard)
+
+	@staticmethod
+	async def _run(llm: BaseChatModel, batch: list[tuple[str, asyncio.Future]]) -> None:
+		try:
+			decisions = await _llm_route(llm, [query for query, _ in batch])
+		except Exception as e:
+			for _, future in batch:
+				if not future.done():
+					future.set_exception(e)
+			return
+
+		for (_, future), decision in zip(batch, decisions):
+			if not future.done():
+				future.set_result(decision)
+
+
+_ROUTING_BATCHER = _RoutingBatcher()
 
 
 async def route_query(
@@ -190,59 +583,43 @@ async def route_query(
 	if force_tool:
 		return ToolDecision(
 			primary_tool=force_tool,
-			secondary_tools=[],
+			secondary_tools=(),
 			reasoning=f"User explicitly requested {force_tool.value} tool",
-			specific_actions=[user_query],
+			specific_actions=(user_query,),
 			original_query=user_query
 		)
 
-	# Quick heuristic for pure chat
+	# Cheap heuristics first, each only when it is the sole signal; mixed or ambiguous queries go to the LLM
 	if is_pure_chat_query(user_query):
-		# Still use LLM for confirmation but bias towards chat
-		pass  # Continue to LLM routing
-
-	try:
-		# Prepare routing prompt
-		prompt = TOOL_ROUTING_PROMPT.format(user_query=user_query)
-
-		# Call LLM for routing decision
-		response = await llm.ainvoke([UserMessage(content=prompt)])
-
-		# Extract text from response
-		if hasattr(response, 'content'):
-			response_text = response.content
-		else:
-			response_text = str(response)
-
-		# Debug: Check if response is empty
-		if not response_text or not response_text.strip():
-			raise ValueError(f"LLM returned empty response. Full response object: {response}")
-
-		# Parse JSON response
-		# Remove markdown code blocks if present
-		response_text = re.sub(r'```json\s*', '', response_text)
-		response_text = re.sub(r'```\s*', '', response_text)
-		response_text = response_text.strip()
-
-		# Debug: Check if cleaned response is valid
-		if not response_text:
-			raise ValueError("Response became empty after cleaning markdown")
-
-		decision_data = json.loads(response_text)
-
-		# Parse tool types
-		primary = ToolType(decision_data["primary_tool"].lower())
-		secondary = [ToolType(t.lower()) for t in decision_data.get("secondary_tools", [])]
+		return ToolDecision(
+			primary_tool=ToolType.CHAT,
+			secondary_tools=(),
+			reasoning="Conversational query",
+			specific_actions=(user_query,),
+			original_query=user_query
+		)
 
+	keyword_tool = confident_keyword_route(user_query)
+	if keyword_tool is not None:
 		return ToolDecision(
-			primary_tool=primary,
-			secondary_tools=secondary,
-			reasoning=decision_data.get("reasoning", ""),
-			specific_actions=decision_data.get("specific_actions", [user_query]),
+			primary_tool=keyword_tool,
+			secondary_tools=(),
+			reasoning=f"Matched only {keyword_tool.value} keywords",
+			specific_actions=(user_query,),
 			original_query=user_query
 		)
 
-	except (json.JSONDecodeError, KeyError, ValueError) as e:
+	# Reuse the decision for a query we (or a near-duplicate) already routed
+	cached = _ROUTING_CACHE.get(user_query)
+	if cached is not None:
+		return cached
+
+	try:
+		decision = await _ROUTING_BATCHER.submit(llm, user_query)
+		_ROUTING_CACHE.put(user_query, decision)
+		return decision
+
+	except (ModelProviderError, KeyError, ValueError) as e:
 		# Fallback: Use heuristic routing
 		return fallback_routing(user_query, error=str(e))
 
@@ -252,54 +629,54 @@ def fallback_routing(query: str, error: str = "") -> ToolDecision:
 	Fallback routing using keyword-based heuristics
 	Used when LLM routing fails
 	"""
-	query_lower = query.lower()
+	hits = _keyword_hits(_TOOL_KEYWORD_RE, query.lower())
 
 	# Email keywords
-	if any(word in query_lower for word in ['email', 'mail', 'inbox', 'send message', 'unread']):
+	if ToolType.EMAIL.value in hits:
 		return ToolDecision(
 			primary_tool=ToolType.EMAIL,
-			secondary_tools=[],
+			secondary_tools=(),
 			reasoning=f"Fallback routing detected email keywords (LLM error: {error})",
-			specific_actions=[query],
+			specific_actions=(query,),
 			original_query=query
 		)
 
 	# Sheets keywords
-	if any(word in query_lower for word in ['spreadsheet', 'sheet', 'excel', 'table', 'row', 'column', 'cell']):
+	if ToolType.SHEETS.value in hits:
 		return ToolDecision(
 			primary_tool=ToolType.SHEETS,
-			secondary_tools=[],
+			secondary_tools=(),
 			reasoning=f"Fallback routing detected sheets keywords (LLM error: {error})",
-			specific_actions=[query],
+			specific_actions=(query,),
 			original_query=query
 		)
 
 	# Calendar keywords (including common misspellings)
-	if any(word in query_lower for word in ['calendar', 'calender', 'schedule', 'meeting', 'appointment', 'event', 'planned', 'tomorrow', 'today']):
+	if ToolType.CALENDAR.value in hits:
 		return ToolDecision(
 			primary_tool=ToolType.CALENDAR,
-			secondary_tools=[],
+			secondary_tools=(),
 			reasoning=f"Fallback routing detected calendar keywords (LLM error: {error})",
-			specific_actions=[query],
+			specific_actions=(query,),
 			original_query=query
 		)
 
 	# Browser keywords
-	if any(word in query_lower for word in ['search', 'find', 'look up', 'browse', 'website', 'google', 'price', 'weather', 'news']):
+	if ToolType.BROWSER.value in hits:
 		return ToolDecision(
 			primary_tool=ToolType.BROWSER,
-			secondary_tools=[],
+			secondary_tools=(),
 			reasoning=f"Fallback routing detected browser keywords (LLM error: {error})",
-			specific_actions=[query],
+			specific_actions=(query,),
 			original_query=query
 		)
 
 	# Default to chat
 	return ToolDecision(
 		primary_tool=ToolType.CHAT,
-		secondary_tools=[],
+		secondary_tools=(),
 		reasoning=f"Fallback routing defaulted to chat (LLM error: {error})",
-		specific_actions=[query],
+		specific_actions=(query,),
 		original_query=query
 	)
 
@@ -314,26 +691,26 @@ def detect_multi_tool_query(query: str) -> List[ToolType]:
 
 	Returns list of tool types in order they should be executed
 	"""
-	query_lower = query.lower()
-	tools = []
-
-	# Pattern matching for multi-tool queries
-	if 'calendar' in query_lower or 'schedule' in query_lower or 'meeting' in query_lower:
-		tools.append(ToolType.CALENDAR)
+	# Cached result is an immutable tuple; hand callers their own list
+	return list(_multi_tools(query.lower()))
 
-	if 'email' in query_lower or 'send' in query_lower and 'message' in query_lower:
-		tools.append(ToolType.EMAIL)
 
-	if any(word in query_lower for word in ['search', 'find', 'look up', 'browse', 'check online']):
-		tools.append(ToolType.BROWSER)
+@functools.lru_cache(maxsize=_HEURISTIC_CACHE_SIZE)
+def _multi_tools(query_lower: str) -> tuple[ToolType, ...]:
+	hits = _keyword_hits(_MULTI_TOOL_RE, query_lower)
 
-	# Look for conjunctions indicating sequence
-	has_conjunction = any(conj in query_lower for conj in [' and ', ' then ', ' after ', ' followed by'])
+	# Tools in the order they should run
+	tools = tuple(
+		tool
+		for name, tool in (('calendar', ToolType.CALENDAR), ('email', ToolType.EMAIL), ('browser', ToolType.BROWSER))
+		if name in hits
+	)
 
-	if has_conjunction and len(tools) > 1:
+	# Only a conjunction indicates a sequence
+	if 'conj' in hits and len(tools) > 1:
 		return tools
 
-	return []
+	return ()
 
 
 def format_routing_decision_log(decision: ToolDecision) -> str:
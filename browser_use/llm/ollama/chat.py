@@ -33,6 +33,8 @@ class ChatOllama(BaseChatModel):
 	timeout: float | httpx.Timeout | None = None
 	client_params: dict[str, Any] | None = None
 	ollama_options: Mapping[str, Any] | Options | None = None
+	# Reused for every call when given, keeping one connection pool
+	client: OllamaAsyncClient | None = None
 
 	# Static
 	@property
@@ -51,6 +53,8 @@ class ChatOllama(BaseChatModel):
 		"""
 		Returns an OllamaAsyncClient client.
 		"""
+		if self.client is not None:
+			return self.client
 		return OllamaAsyncClient(host=self.host, timeout=self.timeout, **self.client_params or {})
 
 	@property
@@ -161,6 +161,20 @@ class MCPClient:
 	async def disconnect(self) -> None:
 		"""Disconnect from the MCP server."""
 		if not self._connected:
+			# A failed connect can leave the stdio task (and the server it spawned) running,
+			# or finished with an exception nobody has retrieved
+			if self._stdio_task is not None:
+				stdio_task, self._stdio_task = self._stdio_task, None
+				stdio_task.cancel()
+				try:
+					await stdio_task
+				except asyncio.CancelledError:
+					# Swallow only the cancellation we just requested, not one aimed at our caller
+					current = asyncio.current_task()
+					if current is not None and current.cancelling():
+						raise
+				except Exception:
+					pass
 			return
 
 		start_time = time.time()
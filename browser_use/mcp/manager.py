@@ -6,66 +6,146 @@ Manages lifecycle of multiple MCP server connections and tool registration
 import os
 import sys
 import asyncio
-import subprocess
+import contextlib
+import functools
 import time
-from typing import Dict, Optional, List, Set
-from pathlib import Path
+from typing import Dict, Optional, List
 from dataclasses import dataclass
 
 from browser_use.mcp.client import MCPClient
 from browser_use.tools.service import Tools
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MCPServerConfig:
 	"""Configuration for an MCP server"""
 	name: str
 	command: str
-	args: List[str]
+	args: tuple[str, ...]
 	port: Optional[int] = None
 	env: Optional[Dict[str, str]] = None
 
 
-# Predefined MCP server configurations
-# Use sys.executable to ensure we use the same Python as the main process
-MCP_SERVER_CONFIGS = {
-	'calendar': MCPServerConfig(
-		name='google-calendar',
-		command=sys.executable,
-		args=['scripts/mcp_calendar_server.py'],
-		port=8002,
-		env={
-			'GOOGLE_CREDENTIALS_PATH': os.getenv('GOOGLE_CREDENTIALS_PATH', 'credentials.json'),
-			'GOOGLE_TOKEN_PATH': os.getenv('GOOGLE_TOKEN_PATH', 'token.pickle'),
-			'MCP_CALENDAR_PORT': str(os.getenv('MCP_CALENDAR_PORT', 8002)),
-			'BROWSER': os.getenv('BROWSER', '/usr/bin/google-chrome')  # For OAuth browser launch
-		}
-	),
-	'gmail': MCPServerConfig(
-		name='gmail',
-		command=sys.executable,
-		args=['scripts/mcp_gmail_server.py'],
-		port=8001,
-		env={
-			'GOOGLE_CREDENTIALS_PATH': os.getenv('GOOGLE_CREDENTIALS_PATH', 'credentials.json'),
-			'GOOGLE_TOKEN_PATH': os.getenv('GOOGLE_TOKEN_PATH', 'gmail_token.pickle'),
-			'MCP_GMAIL_PORT': str(os.getenv('MCP_GMAIL_PORT', 8001)),
-			'BROWSER': os.getenv('BROWSER', '/usr/bin/google-chrome')  # For OAuth browser launch
-		}
-	),
-	'sheets': MCPServerConfig(
-		name='google-sheets',
+# Predefined MCP server definitions (static only; environment is read on first use)
+_SERVER_DEFS = {
+	'calendar': {
+		'name': 'google-calendar',
+		'script': 'scripts/mcp_calendar_server.py',
+		'port': 8002,
+		'env_defaults': {
+			'GOOGLE_CREDENTIALS_PATH': 'credentials.json',
+			'GOOGLE_TOKEN_PATH': 'token.pickle',
+			'MCP_CALENDAR_PORT': '8002',
+			'BROWSER': '/usr/bin/google-chrome',  # For OAuth browser launch
+		},
+	},
+	'gmail': {
+		'name': 'gmail',
+		'script': 'scripts/mcp_gmail_server.py',
+		'port': 8001,
+		'env_defaults': {
+			'GOOGLE_CREDENTIALS_PATH': 'credentials.json',
+			'GOOGLE_TOKEN_PATH': 'gmail_token.pickle',
+			'MCP_GMAIL_PORT': '8001',
+			'BROWSER': '/usr/bin/google-chrome',  # For OAuth browser launch
+		},
+	},
+	'sheets': {
+		'name': 'google-sheets',
+		'script': 'scripts/mcp_sheets_server.py',
+		'port': 8003,
+		'env_defaults': {
+			'GOOGLE_CREDENTIALS_PATH': 'credentials.json',
+			'GOOGLE_TOKEN_PATH': 'sheets_token.pickle',
+			'GOOGLE_SERVICE_ACCOUNT_FILE': '',
+			'BROWSER': '/usr/bin/google-chrome',  # For OAuth browser launch
+		},
+	},
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_config(server_type: str) -> MCPServerConfig:
+	"""
+	Build the config for a server type, reading its environment on first use
+
+	Raises:
+		ValueError: If server_type not recognized
+	"""
+	if server_type not in _SERVER_DEFS:
+		available = ', '.join(_SERVER_DEFS)
+		raise ValueError(f"Unknown server type: {server_type}. Available: {available}")
+
+	definition = _SERVER_DEFS[server_type]
+
+	# Use sys.executable to ensure we use the same Python as the main process
+	return MCPServerConfig(
+		name=definition['name'],
 		command=sys.executable,
-		args=['scripts/mcp_sheets_server.py'],
-		port=8003,
-		env={
-			'GOOGLE_CREDENTIALS_PATH': os.getenv('GOOGLE_CREDENTIALS_PATH', 'credentials.json'),
-			'GOOGLE_TOKEN_PATH': os.getenv('GOOGLE_TOKEN_PATH', 'sheets_token.pickle'),
-			'GOOGLE_SERVICE_ACCOUNT_FILE': os.getenv('GOOGLE_SERVICE_ACCOUNT_FILE', ''),
-			'BROWSER': os.getenv('BROWSER', '/usr/bin/google-chrome')  # For OAuth browser launch
-		}
+		args=(definition['script'],),
+		port=definition['port'],
+		env={key: os.getenv(key, default) for key, default in definition['env_defaults'].items()}
 	)
-}
+
+
+@dataclass
+class _ServerEntry:
+	"""A connected MCP server: its client (which owns the server process) and bookkeeping"""
+	client: MCPClient
+	connected_at: float
+	refcount: int = 0
+
+
+# Server connections shared by every MCPManager in the process, so each server
+# type runs once no matter how many managers (or get_mcp_client calls) use it
+_GLOBAL_SERVERS: Dict[str, _ServerEntry] = {}
+_GLOBAL_LOCKS: Dict[str, asyncio.Lock] = {}
+
+# Seconds to wait for a ping reply in health_check
+_PING_TIMEOUT = 5.0
+
+
+async def _start_server(server_type: str, config: MCPServerConfig) -> _ServerEntry:
+	"""Start an MCP server through its stdio client and add it to the shared registry"""
+	client = None
+
+	try:
+		print(f"🚀 Starting {config.name} MCP server...")
+
+		# MCPClient spawns the server over stdio and owns the process
+		client = MCPClient(
+			server_name=config.name,
+			command=config.command,
+			args=list(config.args),
+			env=config.env
+		)
+
+		# The MCP initialize handshake is the readiness signal, so there is no fixed startup sleep
+		await client.connect()
+
+		entry = _ServerEntry(client=client, connected_at=time.time())
+		_GLOBAL_SERVERS[server_type] = entry
+
+		print(f"✅ Connected to {config.name} MCP server")
+
+		return entry
+
+	except Exception as e:
+		# Cleanup on failure; disconnecting the client also stops the server it spawned
+		if client is not None:
+			with contextlib.suppress(Exception):
+				await client.disconnect()
+
+		raise RuntimeError(f"Failed to connect to {server_type} MCP server: {str(e)}")
+
+
+async def _stop_server(server_type: str):
+	"""Disconnect the shared client, which shuts down the server process"""
+	entry = _GLOBAL_SERVERS.pop(server_type, None)
+	if entry is None:
+		return
+
+	await entry.client.disconnect()
 
 
 class MCPManager:
@@ -76,7 +156,8 @@ class MCPManager:
 	- Lazy-loading of MCP servers on first use
 	- Automatic tool registration to Tools registry
 	- Process lifecycle management
-	- Connection pooling and cleanup
+	- Connection pooling and cleanup (servers are shared across managers and
+	  stopped when the last manager using them disconnects)
 	"""
 
 	def __init__(self, auto_connect: List[str] = None):
@@ -86,9 +167,7 @@ class MCPManager:
 		Args:
 			auto_connect: List of server types to auto-connect on startup
 		"""
-		self.clients: Dict[str, MCPClient] = {}
-		self.processes: Dict[str, subprocess.Popen] = {}
-		self.connected_servers: Set[str] = set()
+		self.servers: Dict[str, _ServerEntry] = {}
 		self.auto_connect = auto_connect or []
 
 	async def connect(self, server_type: str) -> MCPClient:
@@ -105,72 +184,27 @@ class MCPManager:
 			ValueError: If server_type not recognized
 			RuntimeError: If connection fails
 		"""
-		if server_type in self.connected_servers:
-			return self.clients[server_type]
+		entry = self.servers.get(server_type)
+		if entry is not None:
+			return entry.client
 
-		if server_type not in MCP_SERVER_CONFIGS:
-			available = ', '.join(MCP_SERVER_CONFIGS.keys())
-			raise ValueError(f"Unknown server type: {server_type}. Available: {available}")
+		config = _get_config(server_type)
 
-		config = MCP_SERVER_CONFIGS[server_type]
-
-		try:
-			# Start MCP server process
-			print(f"🚀 Starting {config.name} MCP server...")
-
-			# Prepare environment
-			env = os.environ.copy()
-			if config.env:
-				env.update(config.env)
-
-			# Start server process with STDIO pipes for communication
-			process = subprocess.Popen(
-				[config.command] + config.args,
-				env=env,
-				stdin=subprocess.PIPE,
-				stdout=subprocess.PIPE,
-				stderr=subprocess.PIPE,
-				cwd=Path.cwd()
-			)
-
-			self.processes[server_type] = process
-
-			# Wait for server to start
-			await asyncio.sleep(1)
-
-			# Check if process is still running
-			if process.poll() is not None:
-				# Get stderr output for debugging
-				stderr_output = process.stderr.read().decode() if process.stderr else "No error output"
-				raise RuntimeError(f"MCP server process died immediately (exit code: {process.returncode})\nError: {stderr_output}")
-
-			# Create MCP client
-			# Note: MCPClient expects stdio communication, but for HTTP-based MCP servers
-			# we might need a different approach. For now, we'll assume the servers
-			# are running and we connect via HTTP/stdio hybrid
-			client = MCPClient(
-				server_name=config.name,
-				command=config.command,
-				args=config.args,
-				env=config.env
-			)
-
-			await client.connect()
-
-			self.clients[server_type] = client
-			self.connected_servers.add(server_type)
-
-			print(f"✅ Connected to {config.name} MCP server")
+		async with _GLOBAL_LOCKS.setdefault(server_type, asyncio.Lock()):
+			# A concurrent connect on this manager may have finished while we waited;
+			# it already holds the reference, so don't take a second one
+			entry = self.servers.get(server_type)
+			if entry is not None:
+				return entry.client
 
-			return client
+			entry = _GLOBAL_SERVERS.get(server_type)
+			if entry is None:
+				entry = await _start_server(server_type, config)
 
-		except Exception as e:
-			# Cleanup on failure
-			if server_type in self.processes:
-				self.processes[server_type].terminate()
-				del self.processes[server_type]
+			entry.refcount += 1
+			self.servers[server_type] = entry
 
-			raise RuntimeError(f"Failed to connect to {server_type} MCP server: {str(e)}")
+		return entry.client
 
 	async def lazy_connect(self, server_type: str) -> MCPClient:
 		"""
@@ -182,8 +216,9 @@ class MCPManager:
 		Returns:
 			MCPClient instance
 		"""
-		if server_type in self.connected_servers:
-			return self.clients[server_type]
+		entry = self.servers.get(server_type)
+		if entry is not None:
+			return entry.client
 
 		return await self.connect(server_type)
 
@@ -198,10 +233,11 @@ class MCPManager:
 		Returns:
 			Number of tools registered
 		"""
-		if server_type not in self.connected_servers:
+		entry = self.servers.get(server_type)
+		if entry is None:
 			raise RuntimeError(f"Server {server_type} not connected. Call connect() first.")
 
-		client = self.clients[server_type]
+		client = entry.client
 
 		# Register MCP tools to the tools registry
 		await client.register_to_tools(tools)
@@ -220,44 +256,43 @@ class MCPManager:
 		Args:
 			server_type: Type of server to disconnect
 		"""
-		if server_type not in self.connected_servers:
+		entry = self.servers.pop(server_type, None)
+		if entry is None:
 			return
 
-		# Close client connection
-		if server_type in self.clients:
-			client = self.clients[server_type]
-			# await client.close()  # Uncomment if MCPClient has close method
-			del self.clients[server_type]
-
-		# Terminate server process
-		if server_type in self.processes:
-			process = self.processes[server_type]
-			process.terminate()
-
-			# Wait for graceful shutdown
-			try:
-				process.wait(timeout=5)
-			except subprocess.TimeoutExpired:
-				process.kill()
-
-			del self.processes[server_type]
-
-		self.connected_servers.discard(server_type)
+		async with _GLOBAL_LOCKS.setdefault(server_type, asyncio.Lock()):
+			# Skip if the shared server was already stopped after a crash;
+			# otherwise stop it once the last manager using it lets go
+			if _GLOBAL_SERVERS.get(server_type) is entry:
+				entry.refcount -= 1
+				if entry.refcount == 0:
+					await _stop_server(server_type)
 
 		print(f"🔌 Disconnected from {server_type} MCP server")
 
+	async def connect_all(self) -> List[MCPClient]:
+		"""Connect to all auto-connect servers concurrently"""
+		return await asyncio.gather(*(self.connect(server_type) for server_type in self.auto_connect))
+
 	async def disconnect_all(self):
-		"""Disconnect from all MCP servers"""
-		for server_type in list(self.connected_servers):
-			await self.disconnect(server_type)
+		"""Disconnect from all MCP servers concurrently"""
+		await asyncio.gather(
+			*(self.disconnect(server_type) for server_type in list(self.servers)),
+			return_exceptions=True
+		)
 
 	def is_connected(self, server_type: str) -> bool:
 		"""Check if server is connected"""
-		return server_type in self.connected_servers
+		return server_type in self.servers
 
 	def get_connected_servers(self) -> List[str]:
 		"""Get list of connected server types"""
-		return list(self.connected_servers)
+		return list(self.servers)
+
+	def get_client(self, server_type: str) -> Optional[MCPClient]:
+		"""Get the client for a connected server, or None if not connected"""
+		entry = self.servers.get(server_type)
+		return entry.client if entry is not None else None
 
 	async def health_check(self, server_type: str) -> bool:
 		"""
@@ -269,17 +304,24 @@ class MCPManager:
 		Returns:
 			True if server is healthy, False otherwise
 		"""
-		if server_type not in self.connected_servers:
+		entry = self.servers.get(server_type)
+		if entry is None:
 			return False
 
-		# Check if process is still running
-		if server_type in self.processes:
-			process = self.processes[server_type]
-			if process.poll() is not None:
-				# Process died
-				print(f"⚠️  {server_type} MCP server process died (exit code: {process.returncode})")
-				await self.disconnect(server_type)
-				return False
+		# The client owns the server process, so a failed ping means the server is gone
+		session = entry.client.session
+		try:
+			if session is None:
+				raise RuntimeError("no session")
+			await asyncio.wait_for(session.send_ping(), timeout=_PING_TIMEOUT)
+		except Exception:
+			# Server is unresponsive; stop it for every manager so the next connect starts a fresh one
+			print(f"⚠️  {server_type} MCP server is not responding")
+			del self.servers[server_type]
+			async with _GLOBAL_LOCKS.setdefault(server_type, asyncio.Lock()):
+				if _GLOBAL_SERVERS.get(server_type) is entry:
+					await _stop_server(server_type)
+			return False
 
 		return True
 
@@ -298,7 +340,7 @@ class MCPManager:
 
 	def get_available_servers(self) -> List[str]:
 		"""Get list of available (configured) server types"""
-		return list(MCP_SERVER_CONFIGS.keys())
+		return list(_SERVER_DEFS)
 
 	async def ensure_connected(self, server_type: str, tools: Optional[Tools] = None) -> MCPClient:
 		"""
@@ -311,7 +353,8 @@ class MCPManager:
 		Returns:
 			MCPClient instance
 		"""
-		if not self.is_connected(server_type):
+		entry = self.servers.get(server_type)
+		if entry is None:
 			client = await self.connect(server_type)
 
 			if tools:
@@ -319,10 +362,11 @@ class MCPManager:
 
 			return client
 
-		return self.clients[server_type]
+		return entry.client
 
 	async def __aenter__(self):
-		"""Async context manager entry"""
+		"""Async context manager entry - connect auto-connect servers"""
+		await self.connect_all()
 		return self
 
 	async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -330,12 +374,16 @@ class MCPManager:
 		await self.disconnect_all()
 
 
+# Manager behind get_mcp_client, created on first use
+_DEFAULT_MANAGER: Optional['MCPManager'] = None
+
+
 # Convenience function for simple use cases
 async def get_mcp_client(server_type: str) -> MCPClient:
 	"""
 	Get an MCP client for a specific server type
 
-	Simple wrapper for one-off connections
+	Simple wrapper for one-off connections; reuses the shared server if one is running
 
 	Args:
 		server_type: Type of server ('calendar', 'gmail', etc.)
@@ -343,5 +391,7 @@ async def get_mcp_client(server_type: str) -> MCPClient:
 	Returns:
 		MCPClient instance
 	"""
-	manager = MCPManager()
-	return await manager.connect(server_type)
+	global _DEFAULT_MANAGER
+	if _DEFAULT_MANAGER is None:
+		_DEFAULT_MANAGER = MCPManager()
+	return await _DEFAULT_MANAGER.lazy_connect(server_type)
@@ -11,23 +11,36 @@ A clean, emoji-free CLI tool that:
 
 import argparse
 import asyncio
+import contextlib
+import hashlib
+import io
+import itertools
+import json
 import logging
+import os
+import re
 import sys
+import tempfile
+import time
+import traceback
 from pathlib import Path
-from typing import Optional
+from typing import Awaitable, Optional, TextIO, TYPE_CHECKING
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from dotenv import load_dotenv
+# browser_use is slow to import; it is loaded on first use so --help and importers of
+# CleanLogger don't pay for it
+if TYPE_CHECKING:
+	import httpx
 
-load_dotenv()
-
-from browser_use import Agent
-from browser_use.browser.profile import BrowserProfile
+	from browser_use.browser.profile import BrowserProfile
+	from browser_use.browser.session import BrowserSession
 
 
 # Prompting guidelines from https://docs.browser-use.com/customize/agent/prompting-guide
-PROMPT_OPTIMIZATION_TEMPLATE = """You are a prompt optimization expert for browser automation agents.
+# Static instructions go in the system message and the user query alone in the user message,
+# so every optimization call shares an identical, provider-cacheable prefix
+PROMPT_OPTIMIZATION_SYSTEM_PROMPT = """You are a prompt optimization expert for browser automation agents.
 
 Your task is to convert a user's natural query into an optimized, specific prompt for a browser automation agent.
 
@@ -45,11 +58,15 @@ GOOD PROMPT EXAMPLE:
 BAD PROMPT EXAMPLE:
 "Go to website and get some quotes"
 
-USER QUERY: {user_query}
+The user's message is their query. Generate an optimized prompt following the guidelines above.
+Be specific, actionable, and include step-by-step instructions. Reply with the optimized prompt only."""
 
-Generate an optimized prompt following the guidelines above. Be specific, actionable, and include step-by-step instructions.
+# On-disk cache of optimized prompts
+PROMPT_CACHE_PATH = Path.home() / '.cache' / 'browser_use_cli' / 'prompt_cache.json'
 
-OPTIMIZED PROMPT:"""
+# Record of the last successful Ollama connection check, reused for a short while
+_OLLAMA_PROBE_PATH = Path(tempfile.gettempdir()) / 'bu_cli_ollama_probe.json'
+_OLLAMA_PROBE_TTL = 30.0
 
 
 def setup_logging(verbose: bool = False) -> None:
@@ -87,21 +104,53 @@ def setup_logging(verbose: bool = False) -> None:
 class CleanLogger:
 	"""Clean logging without emojis"""
 
+	_HR_EQ = '=' * 70
+	_HR_DASH = '-' * 70
+
 	def __init__(self, verbose: bool = True):
 		self.verbose = verbose
+		# (buffer, real stdout) while inside batched()
+		self._batch: Optional[tuple[io.StringIO, TextIO]] = None
+
+	@contextlib.contextmanager
+	def batched(self):
+		"""Collect everything printed to stdout inside the block and write it in one call
+
+		error() writes out what was collected so far first, so errors keep their place
+		"""
+		buffer = io.StringIO()
+		previous, self._batch = self._batch, (buffer, sys.stdout)
+		try:
+			with contextlib.redirect_stdout(buffer):
+				yield
+		finally:
+			self._flush_batch()
+			self._batch = previous
+
+	def _flush_batch(self):
+		"""Write out stdout collected by the current batched() block, if any"""
+		if self._batch is None:
+			return
+		buffer, stdout = self._batch
+		text = buffer.getvalue()
+		if text:
+			stdout.write(text)
+			stdout.flush()
+			buffer.seek(0)
+			buffer.truncate()
 
 	def header(self, text: str):
 		"""Print section header"""
 		if self.verbose:
-			print(f"\n{'=' * 70}")
+			print(f"\n{self._HR_EQ}")
 			print(f"  {text}")
-			print(f"{'=' * 70}\n")
+			print(f"{self._HR_EQ}\n")
 
 	def step(self, step_num: int, text: str):
 		"""Print step information"""
 		if self.verbose:
 			print(f"\n[Step {step_num}] {text}")
-			print(f"{'-' * 70}")
+			print(self._HR_DASH)
 
 	def info(self, text: str):
 		"""Print info message"""
@@ -111,10 +160,10 @@ class CleanLogger:
 	def thinking(self, text: str):
 		"""Print thinking/reasoning"""
 		if self.verbose:
-			print(f"\n  Thinking:")
-			for line in text.split('\n'):
-				if line.strip():
-					print(f"    {line}")
+			# One write per block so concurrent tasks' output doesn't interleave line by line
+			buffer = ["\n  Thinking:\n"]
+			buffer.extend(f"    {line}\n" for line in text.splitlines() if line.strip())
+			sys.stdout.write("".join(buffer))
 
 	def action(self, action_name: str, params: str):
 		"""Print action being taken"""
@@ -127,48 +176,211 @@ class CleanLogger:
 		"""Print action result"""
 		if self.verbose:
 			if text and text.strip():
-				print(f"\n  Result:")
-				for line in text.split('\n')[:10]:  # Limit output
-					if line.strip():
-						print(f"    {line}")
-				if len(text.split('\n')) > 10:
-					print(f"    ... (output truncated)")
-
-	def error(self, text: str):
-		"""Print error message"""
-		print(f"\n  ERROR: {text}", file=sys.stderr)
+				# Split off at most 10 lines; an 11th piece means there was more
+				lines = text.split('\n', 10)
+				buffer = ["\n  Result:\n"]
+				buffer.extend(f"    {line}\n" for line in lines[:10] if line.strip())  # Limit output
+				if len(lines) > 10:
+					buffer.append("    ... (output truncated)\n")
+				sys.stdout.write("".join(buffer))
+
+	def error(self, text: str, exc_info=None):
+		"""Print error message
+
+		Args:
+			text: Message to print
+			exc_info: Optional (type, value, traceback) tuple; only formatted in verbose mode
+		"""
+		if exc_info and self.verbose:
+			text = f"{text}\n" + "".join(traceback.format_exception(*exc_info)).rstrip()
+		self._flush_batch()
+		sys.stderr.write(f"\n  ERROR: {text}\n")
 
 	def success(self, text: str):
 		"""Print success message"""
 		print(f"\n  SUCCESS: {text}")
 
 
-async def optimize_prompt_with_llm(user_query: str, llm, logger: CleanLogger) -> str:
+class LLMCache:
+	"""JSON file cache of LLM outputs, keyed by a hash of everything that shaped them"""
+
+	def __init__(self, path: Path = PROMPT_CACHE_PATH):
+		self.path = path
+		self._lock = asyncio.Lock()
+		try:
+			self._data: dict[str, str] = json.loads(path.read_text())
+		except (OSError, ValueError):
+			self._data = {}
+
+	@staticmethod
+	def make_key(**parts) -> str:
+		"""Stable SHA256 key over the given parts"""
+		return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+	def get(self, key: str) -> Optional[str]:
+		return self._data.get(key)
+
+	async def set(self, key: str, value: str) -> None:
+		"""Store a value and persist the cache without blocking the event loop"""
+		async with self._lock:
+			self._data[key] = value
+			try:
+				await asyncio.to_thread(self._write, json.dumps(self._data))
+			except OSError:
+				# Read-only or full cache dir: keep the value in memory only
+				pass
+
+	def _write(self, payload: str) -> None:
+		self.path.parent.mkdir(parents=True, exist_ok=True)
+		# Write then rename so an interrupted write never leaves a corrupt cache
+		tmp_path = self.path.with_suffix('.tmp')
+		tmp_path.write_text(payload)
+		tmp_path.replace(self.path)
+
+
+def _http_client(concurrency: int) -> 'httpx.AsyncClient':
+	"""Keep-alive connection pool for SDK clients, sized for concurrent batch tasks"""
+	import httpx
+
+	return httpx.AsyncClient(
+		limits=httpx.Limits(max_keepalive_connections=max(20, concurrency * 2), max_connections=max(40, concurrency * 4)),
+		timeout=60.0,
+	)
+
+
+def _ollama_probe_is_fresh(host: str) -> bool:
+	"""Whether a recent run already confirmed the Ollama server at host is up"""
+	try:
+		probe = json.loads(_OLLAMA_PROBE_PATH.read_text())
+		return probe['ok'] and probe['host'] == host and time.time() - probe['ts'] < _OLLAMA_PROBE_TTL
+	except (OSError, ValueError, KeyError, TypeError):
+		return False
+
+
+def _record_ollama_probe(host: str) -> None:
+	"""Remember a successful Ollama connection check"""
+	try:
+		_OLLAMA_PROBE_PATH.write_text(json.dumps({'host': host, 'ts': time.time(), 'ok': True}))
+	except OSError:
+		pass
+
+
+def _invalidate_ollama_probe(error: BaseException) -> None:
+	"""Forget the last Ollama connection check if error was caused by a lost connection"""
+	while error is not None:
+		if isinstance(error, ConnectionError):
+			_OLLAMA_PROBE_PATH.unlink(missing_ok=True)
+			return
+		error = error.__cause__
+
+
+async def collect_stream(deltas, logger: CleanLogger) -> str:
+	"""Echo streamed text deltas as they arrive and return the full text"""
+	logger.info("\nOptimized Prompt:")
+	if logger.verbose:
+		sys.stdout.write("  ")
+
+	parts = []
+	async for delta in deltas:
+		if delta:
+			parts.append(delta)
+			if logger.verbose:
+				sys.stdout.write(delta)
+				sys.stdout.flush()
+
+	if logger.verbose:
+		sys.stdout.write("\n")
+	return "".join(parts).strip()
+
+
+async def optimize_prompt_with_llm(
+	user_query: str,
+	llm,
+	logger: CleanLogger,
+	cache: Optional[LLMCache] = None,
+	provider: Optional[str] = None,
+	stream: bool = False,
+) -> str:
 	"""Use LLM to optimize the user query into a specific, actionable prompt"""
 	logger.header("PROMPT OPTIMIZATION")
 	logger.info(f"User Query: {user_query}")
 
-	# Create the optimization prompt
-	optimization_prompt = PROMPT_OPTIMIZATION_TEMPLATE.format(user_query=user_query)
+	# Reuse a previous optimization of the same query by the same model
+	cache_key = None
+	if cache is not None:
+		cache_key = LLMCache.make_key(
+			tpl=PROMPT_OPTIMIZATION_SYSTEM_PROMPT,
+			q=user_query,
+			m=getattr(llm, 'model', None),
+			p=provider,
+		)
+		cached_prompt = cache.get(cache_key)
+		if cached_prompt is not None:
+			logger.info("\nOptimized Prompt (cached):")
+			logger.info(f"{cached_prompt}")
+			return cached_prompt
 
 	try:
 		# Call LLM to optimize the prompt
 		logger.info("\nGenerating optimized prompt...")
 
+		streamed = False
+
 		# For OpenAI
 		if hasattr(llm, 'chat'):
 			response = await llm.chat.completions.create(
 				model=llm.model if hasattr(llm, 'model') else "gpt-4o-mini",
-				messages=[{"role": "user", "content": optimization_prompt}],
+				messages=[
+					{"role": "system", "content": PROMPT_OPTIMIZATION_SYSTEM_PROMPT},
+					{"role": "user", "content": user_query},
+				],
+				temperature=0.3,
+				stream=stream,
+			)
+			if stream:
+				optimized_prompt = await collect_stream(
+					(chunk.choices[0].delta.content async for chunk in response if chunk.choices),
+					logger,
+				)
+				streamed = True
+			else:
+				optimized_prompt = response.choices[0].message.content.strip()
+
+		# For Anthropic (mark the system block for prompt caching)
+		elif hasattr(llm, 'messages'):
+			response = await llm.messages.create(
+				model=llm.model,
+				max_tokens=1024,
+				system=[{
+					"type": "text",
+					"text": PROMPT_OPTIMIZATION_SYSTEM_PROMPT,
+					"cache_control": {"type": "ephemeral"},
+				}],
+				messages=[{"role": "user", "content": user_query}],
 				temperature=0.3,
+				stream=stream,
 			)
-			optimized_prompt = response.choices[0].message.content.strip()
+			if stream:
+				optimized_prompt = await collect_stream(
+					(
+						event.delta.text
+						async for event in response
+						if event.type == 'content_block_delta' and event.delta.type == 'text_delta'
+					),
+					logger,
+				)
+				streamed = True
+			else:
+				optimized_prompt = response.content[0].text.strip()
 
-		# For other LLM types (Anthropic, Google, etc.)
+		# For browser_use chat models (Google, Ollama, etc.)
 		else:
-			from browser_use.llm.messages import UserMessage
+			from browser_use.llm.messages import SystemMessage, UserMessage
 
-			messages = [UserMessage(content=optimization_prompt)]
+			messages = [
+				SystemMessage(content=PROMPT_OPTIMIZATION_SYSTEM_PROMPT, cache=True),
+				UserMessage(content=user_query),
+			]
 			response = await llm.ainvoke(messages)
 
 			if hasattr(response, 'completion'):
@@ -176,16 +388,88 @@ async def optimize_prompt_with_llm(user_query: str, llm, logger: CleanLogger) ->
 			else:
 				optimized_prompt = str(response)
 
-		logger.info("\nOptimized Prompt:")
-		logger.info(f"{optimized_prompt}")
-
-		return optimized_prompt
+		if not streamed:
+			logger.info("\nOptimized Prompt:")
+			logger.info(f"{optimized_prompt}")
 
 	except Exception as e:
+		if provider == 'ollama':
+			_invalidate_ollama_probe(e)
 		logger.error(f"Failed to optimize prompt: {str(e)}")
 		logger.info(f"\nFalling back to original query: {user_query}")
 		return user_query
 
+	# Outside the try: failing to persist must not discard a good prompt
+	if cache is not None:
+		await cache.set(cache_key, optimized_prompt)
+
+	return optimized_prompt
+
+
+# Action names from the prompting guidelines; queries already using several of them need no rewrite
+_ACTION_VERBS = frozenset({'navigate', 'click', 'scroll', 'extract', 'search', 'type', 'wait', 'select', 'submit', 'save'})
+_WORD_RE = re.compile(r'[a-z]+')
+
+
+def _looks_optimized(query: str) -> bool:
+	"""Whether query is already long and action-specific enough to run as-is"""
+	return len(query) > 120 and len(_ACTION_VERBS.intersection(_WORD_RE.findall(query.lower()))) >= 2
+
+
+# Innermost frames shown for failures; browser-use tracebacks run through dozens of asyncio frames
+_TRACEBACK_LIMIT = 10
+
+
+def _print_traceback(error: BaseException) -> None:
+	"""Print the last frames of error's traceback (disabled with BU_CLI_TRACEBACK=0)"""
+	if os.getenv('BU_CLI_TRACEBACK', '1') != '0':
+		traceback.print_exception(type(error), error, error.__traceback__, limit=-_TRACEBACK_LIMIT, file=sys.stderr)
+
+
+# Action parameters never worth printing
+_SKIPPED_ACTION_PARAMS = frozenset({'index'})
+
+
+def _action_summary(action) -> tuple[str, str]:
+	"""Name and printable parameters of an agent action
+
+	Args:
+		action: ActionModel (or its RootModel union wrapper) from the agent output
+
+	Returns:
+		Tuple of (action_name, "key=value, ..." string)
+	"""
+	action = getattr(action, 'root', action)
+	for action_name, action_params in action.__dict__.items():
+		if action_params is None:
+			continue
+		# pydantic-core drops None and skipped fields while dumping the (small) params model only
+		dump = getattr(action_params, 'model_dump', None)
+		fields = dump(exclude_none=True, exclude=_SKIPPED_ACTION_PARAMS) if dump else {}
+		return action_name, ", ".join(f"{key}={value}" for key, value in fields.items())
+	return type(action).__name__, ""
+
+
+def _browser_profile(headless: bool) -> 'BrowserProfile':
+	"""Browser profile used for CLI tasks"""
+	from browser_use.browser.profile import BrowserProfile
+
+	return BrowserProfile(
+		headless=headless,
+		keep_alive=False,
+		enable_default_extensions=True,
+		highlight_elements=True,
+	)
+
+
+async def start_browser(headless: bool = False) -> 'BrowserSession':
+	"""Launch the browser ahead of the agent so its cold start can overlap other work"""
+	from browser_use.browser.session import BrowserSession
+
+	browser_session = BrowserSession(browser_profile=_browser_profile(headless))
+	await browser_session.start()
+	return browser_session
+
 
 async def run_browser_task(
 	prompt: str,
@@ -194,8 +478,10 @@ async def run_browser_task(
 	headless: bool = False,
 	max_steps: int = 20,
 	use_vision: bool = True,
+	browser_session: Optional['BrowserSession'] = None,
 ) -> str:
-	"""Execute the browser automation task with detailed output"""
+	"""Execute the browser automation task with detailed output (reusing browser_session if already started)"""
+	from browser_use import Agent
 
 	logger.header("TASK EXECUTION")
 	logger.info(f"Task: {prompt}")
@@ -204,77 +490,52 @@ async def run_browser_task(
 	logger.info(f"Browser Mode: {'Headless' if headless else 'Visible'}")
 
 	try:
-		# Configure browser profile
-		browser_profile = BrowserProfile(
-			headless=headless,
-			keep_alive=False,
-			enable_default_extensions=True,
-			highlight_elements=True,
-		)
-
-		# Create agent
+		# Create agent (on the pre-started browser if there is one)
 		agent = Agent(
 			task=prompt,
 			llm=llm,
 			use_vision=use_vision,
-			browser_profile=browser_profile,
+			browser_session=browser_session,
+			browser_profile=None if browser_session else _browser_profile(headless),
 			use_thinking=True,
 			max_actions_per_step=10,
 		)
 
 		# Hook into agent to display step-by-step output
 		original_step = agent.step
-		step_counter = [0]  # Use list for mutable counter
+		step_numbers = itertools.count(1)
 
 		async def verbose_step(*args, **kwargs):
 			"""Wrapper to log each step"""
-			step_counter[0] += 1
-			logger.step(step_counter[0], "Processing...")
+			logger.step(next(step_numbers), "Processing...")
 
+			previous_output = agent.state.last_model_output
 			result = await original_step(*args, **kwargs)
 
-			# Display thinking
-			if result and hasattr(result, 'model_output') and result.model_output:
-				output = result.model_output
+			# Agent.step returns None; the step's output and results live on agent.state
+			output = agent.state.last_model_output
+			if output is not None and output is not previous_output:
+				# Show thinking, evaluation and next goal
+				if output.thinking:
+					logger.thinking(output.thinking)
 
-				if hasattr(output, 'current_state'):
-					state = output.current_state
+				if output.evaluation_previous_goal:
+					logger.info(f"\nEvaluation: {output.evaluation_previous_goal}")
 
-					# Show thinking
-					if hasattr(state, 'thinking') and state.thinking:
-						logger.thinking(state.thinking)
+				if output.next_goal:
+					logger.info(f"Next Goal: {output.next_goal}")
 
-					# Show evaluation
-					if hasattr(state, 'evaluation_previous_goal') and state.evaluation_previous_goal:
-						logger.info(f"\nEvaluation: {state.evaluation_previous_goal}")
-
-					# Show next goal
-					if hasattr(state, 'next_goal') and state.next_goal:
-						logger.info(f"Next Goal: {state.next_goal}")
-
-				# Show actions
-				if hasattr(output, 'actions') and output.actions:
-					for action in output.actions:
-						action_name = action.__class__.__name__ if hasattr(action, '__class__') else str(action)
-
-						# Get action parameters
-						params = []
-						if hasattr(action, 'model_dump'):
-							action_dict = action.model_dump()
-							for key, value in action_dict.items():
-								if key not in ['index'] and value is not None:
-									params.append(f"{key}={value}")
-
-						logger.action(action_name, ", ".join(params) if params else "")
+				# Show actions with their non-empty parameters
+				for action in output.action:
+					logger.action(*_action_summary(action))
 
 			# Show results
-			if result and hasattr(result, 'result'):
-				for action_result in result.result:
-					if hasattr(action_result, 'extracted_content') and action_result.extracted_content:
-						logger.result(action_result.extracted_content)
+			for action_result in agent.state.last_result or ():
+				if action_result.extracted_content:
+					logger.result(action_result.extracted_content)
 
-					if hasattr(action_result, 'error') and action_result.error:
-						logger.error(action_result.error)
+				if action_result.error:
+					logger.error(action_result.error)
 
 			return result
 
@@ -307,12 +568,146 @@ async def run_browser_task(
 
 	except Exception as e:
 		logger.error(f"Task failed: {str(e)}")
-		import traceback
 		if logger.verbose:
-			traceback.print_exc()
+			_print_traceback(e)
 		return f"Failed: {str(e)}"
 
 
+async def optimize_query(
+	query: str,
+	llm,
+	logger: CleanLogger,
+	args: argparse.Namespace,
+	cache: Optional[LLMCache] = None,
+	stream: bool = False,
+) -> str:
+	"""Optimize the query unless disabled or it is already specific
+
+	Args:
+		query: The user's task
+		llm: LLM client used for prompt optimization
+		logger: CleanLogger for output
+		args: Parsed command-line arguments
+		cache: Optional LLMCache for optimized prompts
+		stream: Print the optimized prompt as it is generated
+
+	Returns:
+		Prompt to run
+	"""
+	if args.no_optimize:
+		logger.info(f"Using query as-is: {query}")
+		return query
+
+	if _looks_optimized(query):
+		logger.info(f"Query already specific, skipping optimization: {query}")
+		return query
+
+	return await optimize_prompt_with_llm(
+		query,
+		llm,
+		logger,
+		cache=cache,
+		provider=args.provider,
+		stream=stream,
+	)
+
+
+async def prepare_task(
+	query: str,
+	llm,
+	logger: CleanLogger,
+	args: argparse.Namespace,
+	cache: Optional[LLMCache] = None,
+	stream: bool = False,
+	optimization: Optional[Awaitable[str]] = None,
+) -> tuple[str, Optional['BrowserSession']]:
+	"""Optimize the query while the browser starts up
+
+	Args:
+		query: The user's task
+		llm: LLM client used for prompt optimization
+		logger: CleanLogger for output
+		args: Parsed command-line arguments
+		cache: Optional LLMCache for optimized prompts
+		stream: Print the optimized prompt as it is generated
+		optimization: Optimization already in progress for this query (skips starting one)
+
+	Returns:
+		Tuple of (prompt to run, started browser session or None if warm-up failed)
+	"""
+	if optimization is None:
+		optimization = optimize_query(query, llm, logger, args, cache=cache, stream=stream)
+
+	optimized_prompt, browser_session = await asyncio.gather(
+		optimization,
+		start_browser(headless=args.headless),
+		return_exceptions=True,
+	)
+
+	if isinstance(optimized_prompt, Exception):
+		optimized_prompt = query
+
+	# If the early start failed, let the agent launch the browser (and report errors) itself
+	if isinstance(browser_session, Exception):
+		logger.info(f"Browser warm-up failed, retrying at task start: {browser_session}")
+		browser_session = None
+
+	return optimized_prompt, browser_session
+
+
+async def run_batch(
+	queries: list[str],
+	llm,
+	logger: CleanLogger,
+	args: argparse.Namespace,
+	cache: Optional[LLMCache] = None,
+) -> list[str]:
+	"""Run several tasks concurrently, sharing one LLM client
+
+	Args:
+		queries: Tasks to run
+		llm: LLM client shared by all tasks
+		logger: CleanLogger for output
+		args: Parsed command-line arguments (--concurrency bounds the tasks in flight)
+		cache: Optional LLMCache for optimized prompts, shared by all tasks
+
+	Returns:
+		One result string per query, in input order
+	"""
+	semaphore = asyncio.Semaphore(args.concurrency)
+
+	# Each distinct query is optimized once; repeats wait on the same task
+	optimizations: dict[str, asyncio.Task] = {}
+
+	async def run_one(query: str) -> str:
+		async with semaphore:
+			if query not in optimizations:
+				# Streaming would interleave with the other tasks' output
+				optimizations[query] = asyncio.create_task(optimize_query(query, llm, logger, args, cache=cache))
+			prompt, browser_session = await prepare_task(
+				query, llm, logger, args, optimization=optimizations[query]
+			)
+			return await run_browser_task(
+				prompt=prompt,
+				llm=llm,
+				logger=logger,
+				headless=args.headless,
+				max_steps=args.max_steps,
+				use_vision=not args.no_vision,
+				browser_session=browser_session,
+			)
+
+	results = await asyncio.gather(*(run_one(query) for query in queries), return_exceptions=True)
+	results = [f"Failed: {result}" if isinstance(result, Exception) else result for result in results]
+
+	logger.header("BATCH RESULTS")
+	for number, (query, result) in enumerate(zip(queries, results), 1):
+		logger.info(f"[{number}] {query}")
+		logger.info(f"    {result}")
+
+	return results
+
+
 def parse_arguments() -> argparse.Namespace:
 	"""Parse command-line arguments"""
 	parser = argparse.ArgumentParser(
@@ -325,6 +720,7 @@ Examples:
   %(prog)s --verbose "get weather in San Francisco"  # Show all thinking
   %(prog)s --no-optimize "navigate to example.com"  # Skip prompt optimization
   %(prog)s --provider openai --model gpt-4o "your task"  # Use OpenAI instead
+  %(prog)s --batch-file tasks.txt --concurrency 4 --headless  # One task per line
 
 Prerequisites:
   1. Install Ollama: https://ollama.com/
@@ -340,6 +736,19 @@ Prerequisites:
 		help='Your natural language query (e.g., "find the top post on Hacker News")',
 	)
 
+	parser.add_argument(
+		'--batch-file',
+		type=Path,
+		help='Run every non-empty line of this file as a task, concurrently',
+	)
+
+	parser.add_argument(
+		'--concurrency',
+		type=int,
+		default=4,
+		help='Maximum tasks run at once with --batch-file (default: 4)',
+	)
+
 	parser.add_argument(
 		'--model',
 		type=str,
@@ -362,6 +771,12 @@ Prerequisites:
 		help='Ollama server URL (default: http://localhost:11434)',
 	)
 
+	parser.add_argument(
+		'--skip-probe',
+		action='store_true',
+		help=f'Skip the Ollama connection test (it is also skipped for {_OLLAMA_PROBE_TTL:.0f}s after a successful one)',
+	)
+
 	parser.add_argument(
 		'--headless',
 		action='store_true',
@@ -387,6 +802,19 @@ Prerequisites:
 		help='Skip prompt optimization step',
 	)
 
+	parser.add_argument(
+		'--no-prompt-cache',
+		action='store_true',
+		help=f'Always regenerate optimized prompts instead of reusing cached ones ({PROMPT_CACHE_PATH})',
+	)
+
+	parser.add_argument(
+		'--stream',
+		action=argparse.BooleanOptionalAction,
+		default=None,
+		help='Print the optimized prompt live as it is generated (default: on unless --quiet)',
+	)
+
 	parser.add_argument(
 		'--quiet',
 		action='store_true',
@@ -407,9 +835,21 @@ async def main() -> int:
 	"""Main entry point"""
 	args = parse_arguments()
 
-	# Get query
+	# Get query (or queries)
 	query = args.query
-	if not query:
+	if args.batch_file:
+		try:
+			queries = [line.strip() for line in args.batch_file.read_text().splitlines() if line.strip()]
+		except OSError as e:
+			print(f"Error: Cannot read batch file: {e}")
+			return 1
+		if not queries:
+			print(f"Error: No tasks in {args.batch_file}")
+			return 1
+		if args.concurrency < 1:
+			print("Error: --concurrency must be at least 1")
+			return 1
+	elif not query:
 		query = input("Enter your task: ").strip()
 		if not query:
 			print("Error: No task provided")
@@ -423,14 +863,16 @@ async def main() -> int:
 
 	# Print banner
 	if not args.quiet:
-		print("\n" + "=" * 70)
+		print("\n" + CleanLogger._HR_EQ)
 		print("  Browser-Use Interactive CLI")
 		print("  Clean, emoji-free browser automation")
-		print("=" * 70)
+		print(CleanLogger._HR_EQ)
+
+	# Connection pool handed to the raw OpenAI/Anthropic SDK clients, closed on exit
+	http_client = None
 
 	try:
 		# Set environment variable based on verbose mode
-		import os
 		if args.verbose:
 			# Show all logs in verbose mode
 			os.environ['BROWSER_USE_LOGGING_LEVEL'] = 'info'
@@ -445,7 +887,6 @@ async def main() -> int:
 
 		if args.provider == 'openai':
 			from openai import AsyncOpenAI
-			import os
 
 			api_key = os.getenv('OPENAI_API_KEY')
 			if not api_key:
@@ -454,14 +895,14 @@ async def main() -> int:
 				logger.info("  export OPENAI_API_KEY=your_key_here")
 				return 1
 
-			llm = AsyncOpenAI(api_key=api_key)
+			http_client = _http_client(args.concurrency)
+			llm = AsyncOpenAI(api_key=api_key, http_client=http_client)
 			# Store model name for later use
 			llm.model = args.model
 			logger.info("OpenAI client initialized")
 
 		elif args.provider == 'anthropic':
 			from anthropic import AsyncAnthropic
-			import os
 
 			api_key = os.getenv('ANTHROPIC_API_KEY')
 			if not api_key:
@@ -470,7 +911,8 @@ async def main() -> int:
 				logger.info("  export ANTHROPIC_API_KEY=your_key_here")
 				return 1
 
-			llm = AsyncAnthropic(api_key=api_key)
+			http_client = _http_client(args.concurrency)
+			llm = AsyncAnthropic(api_key=api_key, http_client=http_client)
 			# Store model name for later use
 			llm.model = args.model
 			logger.info("Anthropic client initialized")
@@ -492,20 +934,24 @@ async def main() -> int:
 			from browser_use.llm.ollama.chat import ChatOllama
 			from ollama import AsyncClient
 
-			# Test connection to Ollama first
-			logger.info(f"Testing connection to Ollama server at {args.host}...")
-			try:
-				client = AsyncClient(host=args.host)
-				await client.list()
-				logger.info("Connected to Ollama server")
-			except Exception as e:
-				logger.error(f"Failed to connect to Ollama server at {args.host}")
-				logger.error(f"Error: {str(e)}")
-				logger.info("\nMake sure Ollama is running:")
-				logger.info("  ollama serve")
-				logger.info(f"\nAnd the model is available:")
-				logger.info(f"  ollama pull {args.model}")
-				return 1
+			# Test connection to Ollama first, unless a recent run already did
+			if args.skip_probe or _ollama_probe_is_fresh(args.host):
+				logger.info(f"Using Ollama server at {args.host} (connection test skipped)")
+			else:
+				logger.info(f"Testing connection to Ollama server at {args.host}...")
+				try:
+					client = AsyncClient(host=args.host)
+					await client.list()
+					_record_ollama_probe(args.host)
+					logger.info("Connected to Ollama server")
+				except Exception as e:
+					logger.error(f"Failed to connect to Ollama server at {args.host}")
+					logger.error(f"Error: {str(e)}")
+					logger.info("\nMake sure Ollama is running:")
+					logger.info("  ollama serve")
+					logger.info(f"\nAnd the model is available:")
+					logger.info(f"  ollama pull {args.model}")
+					return 1
 
 			llm = ChatOllama(model=args.model, host=args.host)
 			logger.info(f"Ollama client initialized with model: {args.model}")
@@ -514,12 +960,22 @@ async def main() -> int:
 			logger.error(f"Unknown provider: {args.provider}")
 			return 1
 
-		# Optimize prompt (unless disabled)
-		if not args.no_optimize:
-			optimized_prompt = await optimize_prompt_with_llm(query, llm, logger)
-		else:
-			optimized_prompt = query
-			logger.info(f"Using query as-is: {query}")
+		prompt_cache = None if args.no_prompt_cache else LLMCache()
+
+		if args.batch_file:
+			results = await run_batch(queries, llm, logger, args, cache=prompt_cache)
+			if args.quiet:
+				print("\n".join(str(result) for result in results))
+			return 0
+
+		optimized_prompt, browser_session = await prepare_task(
+			query,
+			llm,
+			logger,
+			args,
+			cache=prompt_cache,
+			stream=args.stream if args.stream is not None else not args.quiet,
+		)
 
 		# Execute task
 		result = await run_browser_task(
@@ -529,6 +985,7 @@ async def main() -> int:
 			headless=args.headless,
 			max_steps=args.max_steps,
 			use_vision=not args.no_vision,
+			browser_session=browser_session,
 		)
 
 		# Print final result for quiet mode
@@ -542,14 +999,23 @@ async def main() -> int:
 		return 130
 
 	except Exception as e:
+		if args.provider == 'ollama':
+			_invalidate_ollama_probe(e)
 		logger.error(f"Fatal error: {str(e)}")
-		import traceback
 		if not args.quiet:
-			traceback.print_exc()
+			_print_traceback(e)
 		return 1
 
+	finally:
+		if http_client is not None:
+			await http_client.aclose()
+
 
 if __name__ == '__main__':
+	from dotenv import load_dotenv
+
+	load_dotenv()
+
 	try:
 		exit_code = asyncio.run(main())
 		sys.exit(exit_code)
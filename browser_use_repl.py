@@ -15,22 +15,31 @@ Usage:
 	python browser_use_repl.py                              # Default (Ollama)
 	python browser_use_repl.py --provider openai --model gpt-4o
 	python browser_use_repl.py --optimize --headless
+	python browser_use_repl.py --legacy                     # Browser-only legacy REPL
 """
 
 import asyncio
+import atexit
+import importlib
 import os
+import signal
 import sys
+import threading
 from pathlib import Path
+from typing import Optional
 
-sys.path.insert(0, str(Path(__file__).parent))
-
-from dotenv import load_dotenv
-load_dotenv()
+_REPO_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(_REPO_ROOT))
 
 from browser_use_interactive import setup_logging, CleanLogger
-from repl.cli import parse_arguments, create_llm_from_args, setup_mcp_environment
-from repl.session_manager import SessionManager
-from repl.commands import CommandHandler
+from repl.cli import (
+	parse_arguments,
+	create_llm_from_args,
+	create_router_llm,
+	close_llm,
+	setup_mcp_environment,
+	warm_llm_connection,
+)
 
 # Readline for command history
 try:
@@ -39,8 +48,204 @@ try:
 except ImportError:
 	READLINE_AVAILABLE = False
 
+# Terminal control for capturing keystrokes typed during startup (POSIX only)
+try:
+	import termios
+	import tty
+	TERMIOS_AVAILABLE = True
+except ImportError:
+	TERMIOS_AVAILABLE = False
+
+
+class EarlyInput:
+	"""Buffers keystrokes typed while the REPL is still starting so they aren't lost"""
+
+	def __init__(self):
+		self._fd = None
+		self._saved_attrs = None
+		self._buffer = bytearray()
+
+	def start(self) -> None:
+		"""Put the terminal in cbreak mode and collect input on the running event loop"""
+		if not TERMIOS_AVAILABLE or not sys.stdin.isatty():
+			return
+		self._fd = sys.stdin.fileno()
+		self._saved_attrs = termios.tcgetattr(self._fd)
+		tty.setcbreak(self._fd)
+		asyncio.get_running_loop().add_reader(self._fd, self._read)
+
+	def _read(self) -> None:
+		self._buffer.extend(os.read(self._fd, 4096))
+
+	def stop(self) -> str:
+		"""Restore the terminal and return the first line typed so far (safe to call repeatedly)"""
+		if self._fd is None:
+			return ""
+		asyncio.get_running_loop().remove_reader(self._fd)
+		termios.tcsetattr(self._fd, termios.TCSANOW, self._saved_attrs)
+		self._fd = None
+		return self._buffer.decode(errors='ignore').split('\n', 1)[0]
+
+
+class LineReader:
+	"""Reads prompt lines on a worker thread so the event loop keeps running while the user types"""
+
+	def __init__(self):
+		self._pending: Optional[asyncio.Future] = None
+		self._fd = None
+		self._saved_attrs = None
+		if TERMIOS_AVAILABLE and sys.stdin.isatty():
+			self._fd = sys.stdin.fileno()
+			self._saved_attrs = termios.tcgetattr(self._fd)
+
+	def _start(self, prompt: str) -> asyncio.Future:
+		loop = asyncio.get_running_loop()
+		future = loop.create_future()
+
+		def settle(line: Optional[str], error: Optional[BaseException]) -> None:
+			if not future.done():
+				if error is None:
+					future.set_result(line)
+				else:
+					future.set_exception(error)
+
+		def read() -> None:
+			try:
+				line = input(prompt)
+			except BaseException as e:
+				loop.call_soon_threadsafe(settle, None, e)
+			else:
+				loop.call_soon_threadsafe(settle, line, None)
+
+		# Daemon thread: a read still waiting on the terminal must not hold up interpreter exit
+		threading.Thread(target=read, name='repl-input', daemon=True).start()
+		return future
+
+	async def read(self, prompt: str) -> str:
+		"""
+		Read one line
+
+		Ctrl+C raises KeyboardInterrupt but leaves the line being edited in place;
+		the next call resumes it instead of starting a second reader.
+
+		Args:
+			prompt: Prompt shown before the line
+
+		Returns:
+			The line, without its newline (EOFError at end of input)
+		"""
+		loop = asyncio.get_running_loop()
+		if self._pending is None:
+			self._pending = self._start(prompt)
+		else:
+			sys.stdout.write(prompt + (readline.get_line_buffer() if READLINE_AVAILABLE else ""))
+			sys.stdout.flush()
+
+		interrupted = loop.create_future()
+		previous_handler = signal.getsignal(signal.SIGINT)
+		try:
+			loop.add_signal_handler(signal.SIGINT, lambda: interrupted.done() or interrupted.set_result(None))
+		except (NotImplementedError, RuntimeError):
+			previous_handler = None  # No loop signal handlers (Windows); Ctrl+C cancels the task instead
+
+		try:
+			await asyncio.wait((self._pending, interrupted), return_when=asyncio.FIRST_COMPLETED)
+		finally:
+			if previous_handler is not None:
+				loop.remove_signal_handler(signal.SIGINT)
+				signal.signal(signal.SIGINT, previous_handler)
+
+		if not self._pending.done():
+			raise KeyboardInterrupt
+		future, self._pending = self._pending, None
+		return future.result()
+
+	def close(self) -> None:
+		"""Restore the terminal if a read is still in progress (readline leaves it in raw mode)"""
+		if self._pending is not None and self._saved_attrs is not None:
+			termios.tcsetattr(self._fd, termios.TCSANOW, self._saved_attrs)
+
+
+# Readline history location, as the str readline's functions take
+_HISTORY_FILE = str(Path.home() / '.browser_use_repl_history')
 
-async def run_repl(llm, logger: CleanLogger, args) -> int:
+# Commands between readline history saves (the file is also written at exit)
+_HISTORY_FLUSH_EVERY = 20
+
+# Erase the screen and home the cursor (no `clear` subprocess)
+_CLEAR_SCREEN = '\033[2J\033[H'
+
+# Welcome banner: bold neon cyan ASCII art, then tools, usage and Chrome connection help
+_BANNER_TEMPLATE = """\033[1;96m
+ ███████╗██╗   ██╗██████╗ ███████╗██████╗      █████╗  ██████╗ ███████╗███╗   ██╗████████╗
+ ██╔════╝██║   ██║██╔══██╗██╔════╝██╔══██╗    ██╔══██╗██╔════╝ ██╔════╝████╗  ██║╚══██╔══╝
+ ███████╗██║   ██║██████╔╝█████╗  ██████╔╝    ███████║██║  ███╗█████╗  ██╔██╗ ██║   ██║
+ ╚════██║██║   ██║██╔═══╝ ██╔══╝  ██╔══██╗    ██╔══██║██║   ██║██╔══╝  ██║╚██╗██║   ██║
+ ███████║╚██████╔╝██║     ███████╗██║  ██║    ██║  ██║╚██████╔╝███████╗██║ ╚████║   ██║
+ ╚══════╝ ╚═════╝ ╚═╝     ╚══════╝╚═╝  ╚═╝    ╚═╝  ╚═╝ ╚═════╝ ╚══════╝╚═╝  ╚═══╝   ╚═╝
+\033[0m
+""" + "=" * 88 + """
+
+AVAILABLE TOOLS:
+  Browser    │ Web automation and data extraction (always available)
+  Chat       │ Natural language conversations ({chat_status})
+  Calendar   │ Google Calendar management ({mcp_status})
+  Email      │ Gmail operations ({mcp_status})
+  Sheets     │ Google Sheets operations ({mcp_status})
+
+USAGE:
+  • Type naturally - AI automatically selects the appropriate tool
+  • Force specific tool: /browser, /email, /calendar, /sheets, /chat
+  • Commands: /help (show all commands) | /exit (quit application)
+
+CHROME CONNECTION:
+  • Automatically connects to existing Chrome instance on port 9222
+  • To use existing Chrome session, launch it first with:
+    $ google-chrome --remote-debugging-port=9222 --user-data-dir=/tmp/chrome-debug
+  • Verify connection: curl http://localhost:9222/json/version
+
+""" + "=" * 88 + "\n\n"
+
+# Rendered banner for each (disable_chat, disable_mcp) combination
+_BANNERS: dict[tuple[bool, bool], str] = {
+	(disable_chat, disable_mcp): _BANNER_TEMPLATE.format(
+		chat_status="enabled" if not disable_chat else "disabled",
+		mcp_status="MCP enabled" if not disable_mcp else "disabled",
+	)
+	for disable_chat in (False, True)
+	for disable_mcp in (False, True)
+}
+
+
+def _load_history() -> Optional[str]:
+	"""
+	Load the readline history file and save it again at exit
+
+	Returns:
+		History file path, or None without readline
+	"""
+	if not READLINE_AVAILABLE:
+		return None
+
+	history_file = _HISTORY_FILE
+	try:
+		readline.read_history_file(history_file)
+	except FileNotFoundError:
+		pass
+	readline.set_history_length(1000)
+	# Saved on exit and every few commands instead of rewriting the file per prompt
+	atexit.register(readline.write_history_file, history_file)
+	return history_file
+
+
+async def run_repl(
+	llm,
+	logger: CleanLogger,
+	args,
+	router_llm=None,
+	early_input: Optional[EarlyInput] = None,
+	history_file: Optional[str] = None,
+) -> int:
 	"""
 	Run the interactive REPL loop
 
@@ -48,10 +253,17 @@ async def run_repl(llm, logger: CleanLogger, args) -> int:
 		llm: Language model instance
 		logger: Logger for output
 		args: Parsed command-line arguments
+		router_llm: Optional smaller model for tool routing
+		early_input: Startup keystroke buffer, replayed into the first prompt
+		history_file: Readline history path from _load_history() (loaded here when None)
 
 	Returns:
 		Exit code (0 for success)
 	"""
+	# Imported here so --help and argument errors don't load browser_use
+	from repl.commands import CommandHandler
+	from repl.session_manager import SessionManager
+
 	# Create session manager
 	session = SessionManager(
 		llm=llm,
@@ -65,80 +277,73 @@ async def run_repl(llm, logger: CleanLogger, args) -> int:
 		cdp_url=args.cdp_url,
 		enable_mcp=not args.disable_mcp,
 		disable_chat=args.disable_chat,
+		router_llm=router_llm,
+		prompt_cache=not args.no_prompt_cache,
 	)
 
 	# Create command handler
 	cmd_handler = CommandHandler(session=session, logger=logger)
 
-	# Setup readline history
-	history_file = None
-	if READLINE_AVAILABLE:
-		history_file = Path.home() / '.browser_use_repl_history'
-		try:
-			readline.read_history_file(history_file)
-		except FileNotFoundError:
-			pass
-		readline.set_history_length(1000)
+	# Setup readline history (main() normally has it loaded already)
+	if history_file is None:
+		history_file = _load_history()
+	unsaved_entries = 0
 
-	# Clear terminal and display ASCII art welcome message
-	os.system('clear' if os.name != 'nt' else 'cls')
+	# Clear terminal and display ASCII art welcome message in a single write (nothing in quiet mode)
+	if not args.quiet:
+		if os.name == 'nt':
+			os.system('cls')
+			clear = ''
+		else:
+			clear = _CLEAR_SCREEN
+		sys.stdout.write(clear + _BANNERS[args.disable_chat, args.disable_mcp])
+		sys.stdout.flush()
 
-	# Bold neon cyan for cyberpunk aesthetic
-	neon_cyan = '\033[1;96m'
-	reset = '\033[0m'
+	# Pre-fill the first prompt with anything typed during startup
+	typed_ahead = early_input.stop() if early_input else ""
+	if typed_ahead and READLINE_AVAILABLE:
+		def prefill():
+			readline.insert_text(typed_ahead)
+			readline.set_startup_hook(None)
 
-	ascii_art = f"""{neon_cyan}
- ███████╗██╗   ██╗██████╗ ███████╗██████╗      █████╗  ██████╗ ███████╗███╗   ██╗████████╗
- ██╔════╝██║   ██║██╔══██╗██╔════╝██╔══██╗    ██╔══██╗██╔════╝ ██╔════╝████╗  ██║╚══██╔══╝
- ███████╗██║   ██║██████╔╝█████╗  ██████╔╝    ███████║██║  ███╗█████╗  ██╔██╗ ██║   ██║
- ╚════██║██║   ██║██╔═══╝ ██╔══╝  ██╔══██╗    ██╔══██║██║   ██║██╔══╝  ██║╚██╗██║   ██║
- ███████║╚██████╔╝██║     ███████╗██║  ██║    ██║  ██║╚██████╔╝███████╗██║ ╚████║   ██║
- ╚══════╝ ╚═════╝ ╚═╝     ╚══════╝╚═╝  ╚═╝    ╚═╝  ╚═╝ ╚═════╝ ╚══════╝╚═╝  ╚═══╝   ╚═╝
-{reset}"""
-
-	print(ascii_art)
-
-	print("=" * 88)
-	print()
-	print("AVAILABLE TOOLS:")
-	print("  Browser    │ Web automation and data extraction (always available)")
-	print("  Chat       │ Natural language conversations" + (" (enabled)" if not args.disable_chat else " (disabled)"))
-	print("  Calendar   │ Google Calendar management" + (" (MCP enabled)" if not args.disable_mcp else " (disabled)"))
-	print("  Email      │ Gmail operations" + (" (MCP enabled)" if not args.disable_mcp else " (disabled)"))
-	print("  Sheets     │ Google Sheets operations" + (" (MCP enabled)" if not args.disable_mcp else " (disabled)"))
-	print()
-	print("USAGE:")
-	print("  • Type naturally - AI automatically selects the appropriate tool")
-	print("  • Force specific tool: /browser, /email, /calendar, /sheets, /chat")
-	print("  • Commands: /help (show all commands) | /exit (quit application)")
-	print()
-	print("CHROME CONNECTION:")
-	print("  • Automatically connects to existing Chrome instance on port 9222")
-	print("  • To use existing Chrome session, launch it first with:")
-	print("    $ google-chrome --remote-debugging-port=9222 --user-data-dir=/tmp/chrome-debug")
-	print("  • Verify connection: curl http://localhost:9222/json/version")
-	print()
-	print("=" * 88)
-	print()
+		readline.set_startup_hook(prefill)
+
+	# Reading on a worker thread lets background work (provider warmup, MCP I/O) run while the user types
+	line_reader = LineReader()
+	force_quit_armed = False
 
 	try:
 		while True:
 			try:
 				# Get user input
-				query = input("> ").strip()
+				query = (await line_reader.read("> ")).strip()
+				force_quit_armed = False
 
 				if not query:
 					continue
 
-				# Add to history
-				session.command_history.append(query)
-				if READLINE_AVAILABLE and history_file:
-					readline.write_history_file(history_file)
+				# Add to history, except bare meta-commands (/help, /exit, ...) that aren't worth recalling;
+				# tool-forcing commands with a query (/browser find flights) are kept
+				if query.startswith('/') and ' ' not in query:
+					if history_file:
+						# readline recorded the line while reading it
+						readline.remove_history_item(readline.get_current_history_length() - 1)
+				else:
+					# Short queries repeat a lot; interning shares one string per distinct query
+					session.command_history.append(sys.intern(query) if len(query) < 256 else query)
+					if history_file:
+						unsaved_entries += 1
+						if unsaved_entries >= _HISTORY_FLUSH_EVERY:
+							readline.write_history_file(history_file)
+							unsaved_entries = 0
 
 				# Handle special commands
 				if query.startswith('/'):
-					command_str = query[1:]
-					should_continue = await cmd_handler.handle_command(command_str)
+					command, command_args = cmd_handler.parse_command(query[1:])
+					# Display commands return right away; only I/O commands are awaited
+					should_continue = cmd_handler.try_handle_sync(command, command_args)
+					if should_continue is None:
+						should_continue = await cmd_handler.handle_async(command, command_args)
 
 					if not should_continue:
 						break  # Exit REPL
@@ -150,15 +355,15 @@ async def run_repl(llm, logger: CleanLogger, args) -> int:
 
 				# Display result if not empty
 				if result:
-					print(f"\n{result}\n")
+					sys.stdout.write(f"\n{result}\n\n")
+					sys.stdout.flush()
 
 			except KeyboardInterrupt:
-				print("\n\nUse /exit to quit, or Ctrl+C again to force quit")
-				try:
-					confirm = input("Press Ctrl+C again within 2 seconds to force quit: ")
-				except KeyboardInterrupt:
+				if force_quit_armed:
 					logger.info("\nForce quitting...")
 					break
+				force_quit_armed = True
+				print("\n\nUse /exit to quit, or Ctrl+C again to force quit")
 				continue
 
 			except EOFError:
@@ -167,6 +372,7 @@ async def run_repl(llm, logger: CleanLogger, args) -> int:
 
 	finally:
 		# Cleanup
+		line_reader.close()
 		logger.info("Cleaning up...")
 		await session.cleanup()
 		logger.success("Goodbye!")
@@ -176,9 +382,18 @@ async def run_repl(llm, logger: CleanLogger, args) -> int:
 
 async def main() -> int:
 	"""Main entry point"""
+	early_input = EarlyInput()
+	args = None
+	llm = None
+	warmup = None
 	try:
 		# Parse arguments
 		args = parse_arguments()
+		early_input.start()
+
+		# Read .env only once we know we're starting (not for --help or argument errors)
+		from dotenv import load_dotenv
+		load_dotenv()
 
 		# Setup logging
 		setup_logging(verbose=args.verbose)
@@ -193,13 +408,39 @@ async def main() -> int:
 		# Setup MCP environment
 		setup_mcp_environment(args)
 
+		# Load readline history on a thread while the provider connection is checked
+		history_task = None if args.legacy else asyncio.create_task(asyncio.to_thread(_load_history))
+
 		# Initialize LLM
 		llm, exit_code = await create_llm_from_args(args, logger)
 		if exit_code != 0:
 			return exit_code
 
+		if args.legacy:
+			# Imported only when selected so normal startups don't load it
+			legacy = importlib.import_module('repl.legacy_session')
+			early_input.stop()
+			return await legacy.run_repl(
+				llm=llm,
+				logger=logger,
+				headless=args.headless,
+				max_steps=args.max_steps,
+				use_vision=not args.no_vision,
+				optimize_prompts=args.optimize,
+				user_data_dir=args.user_data_dir,
+				profile_directory=args.profile_directory,
+				cdp_url=args.cdp_url,
+			)
+
+		router_llm = create_router_llm(args, llm, logger)
+
+		# Connect to the provider while the banner is read and the first query typed
+		warmup = asyncio.create_task(warm_llm_connection(args, llm))
+
 		# Run REPL
-		return await run_repl(llm, logger, args)
+		return await run_repl(
+			llm, logger, args, router_llm=router_llm, early_input=early_input, history_file=await history_task
+		)
 
 	except KeyboardInterrupt:
 		print("\n\nInterrupted by user")
@@ -211,6 +452,21 @@ async def main() -> int:
 		traceback.print_exc()
 		return 1
 
+	finally:
+		early_input.stop()
+		if warmup is not None:
+			warmup.cancel()
+		if args is not None:
+			await close_llm(args, llm)
+
 
 if __name__ == '__main__':
-	sys.exit(asyncio.run(main()))
+	# uvloop's libuv event loop, when installed, cuts per-await overhead; asyncio's own loop otherwise
+	try:
+		import uvloop
+		loop_factory = uvloop.new_event_loop
+	except ImportError:
+		loop_factory = None
+
+	with asyncio.Runner(loop_factory=loop_factory) as runner:
+		sys.exit(runner.run(main()))
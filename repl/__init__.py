@@ -3,10 +3,24 @@ Browser-Use REPL Modules
 Modular components for the interactive REPL system
 """
 
-from repl.prompt_optimizer import optimize_prompt
-from repl.session_manager import SessionManager
-from repl.commands import CommandHandler
-from repl.cli import parse_arguments, create_llm_from_args
+import importlib
+
+# Submodules pull in browser_use, so exports are imported on first access (PEP 562);
+# importing e.g. repl.cli for --help stays cheap
+_EXPORTS = {
+	'optimize_prompt': 'repl.prompt_optimizer',
+	'SessionManager': 'repl.session_manager',
+	'CommandHandler': 'repl.commands',
+	'parse_arguments': 'repl.cli',
+	'create_llm_from_args': 'repl.cli',
+}
+
+
+def __getattr__(name: str):
+	if name in _EXPORTS:
+		return getattr(importlib.import_module(_EXPORTS[name]), name)
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
 	'optimize_prompt',
@@ -0,0 +1,12 @@
+"""
+JSON Codec Module
+Shared loads for the REPL: orjson when installed, the standard library otherwise
+"""
+
+try:
+	# orjson.JSONDecodeError subclasses json.JSONDecodeError (a ValueError), so callers catch the same errors
+	from orjson import loads
+except ImportError:
+	from json import loads
+
+__all__ = ['loads']
@@ -4,25 +4,41 @@ Command-line argument parsing and LLM initialization
 """
 
 import argparse
+import functools
 import os
-from typing import Tuple
+import types
+from typing import Optional, Tuple
 
 from browser_use_interactive import CleanLogger
 
-
-def parse_arguments() -> argparse.Namespace:
-	"""Parse command-line arguments"""
-	parser = argparse.ArgumentParser(
-		description='Browser-Use Interactive REPL with Multi-Tool Support (Browser, Calendar, Email, Chat)',
-		formatter_class=argparse.RawDescriptionHelpFormatter,
-		epilog="""
+# Ollama request timeout in seconds; local models can take minutes on long prompts
+_OLLAMA_TIMEOUT = 300.0
+
+# Known Groq models that users might confuse with Ollama syntax -> their Groq name
+_GROQ_MODELS = types.MappingProxyType({
+	'gpt-oss-20b': 'openai/gpt-oss-20b',
+	'gpt-oss-120b': 'openai/gpt-oss-120b',
+	'gpt-oss:20b': 'openai/gpt-oss-20b',
+	'gpt-oss:120b': 'openai/gpt-oss-120b',
+})
+
+# MCP environment defaults, applied only where the variable isn't already set
+_MCP_ENV_DEFAULTS = (
+	('GOOGLE_TOKEN_PATH', 'token.pickle'),
+	('MCP_CALENDAR_PORT', '8002'),
+	('MCP_GMAIL_PORT', '8001'),
+)
+
+_EPILOG = """
 Examples:
   %(prog)s                                    # Use Ollama (default, free)
   %(prog)s --provider openai --model gpt-4o  # Use OpenAI
+  %(prog)s --provider openai --model gpt-4o --router-model gpt-4o-mini  # Cheaper routing
   %(prog)s --headless --no-vision            # Headless mode
   %(prog)s --optimize                        # Enable prompt optimization
   %(prog)s --disable-mcp                     # Disable calendar/email tools
   %(prog)s --disable-chat                    # Disable pure chat mode
+  %(prog)s --legacy                          # Browser-only legacy REPL
 
 Multi-Tool Usage:
   > What's 2+2?                              # Chat (auto-routed)
@@ -39,7 +55,16 @@ Prerequisites (for Ollama):
 
 Prerequisites (for MCP - Google Calendar/Gmail):
   See docs/MCP_SETUP_GUIDE.md for OAuth setup
-		""",
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+	"""Build the REPL's argument parser (once per process)"""
+	parser = argparse.ArgumentParser(
+		description='Browser-Use Interactive REPL with Multi-Tool Support (Browser, Calendar, Email, Chat)',
+		formatter_class=argparse.RawDescriptionHelpFormatter,
+		epilog=_EPILOG,
 	)
 
 	# LLM Configuration
@@ -60,6 +85,18 @@ Prerequisites (for MCP - Google Calendar/Gmail):
 		help='LLM provider (default: ollama)',
 	)
 
+	llm_group.add_argument(
+		'--router-model',
+		type=str,
+		help='Smaller model (same provider) for tool routing decisions (default: same as --model)',
+	)
+
+	llm_group.add_argument(
+		'--no-prompt-cache',
+		action='store_true',
+		help='Do not mark static system prompts for provider prompt caching (Anthropic)',
+	)
+
 	llm_group.add_argument(
 		'--host',
 		type=str,
@@ -128,6 +165,12 @@ Prerequisites (for MCP - Google Calendar/Gmail):
 		help='Disable pure chat mode (always use tools)',
 	)
 
+	tool_group.add_argument(
+		'--legacy',
+		action='store_true',
+		help='Use the legacy browser-only REPL (no tool routing, MCP or chat)',
+	)
+
 	tool_group.add_argument(
 		'--google-credentials',
 		type=str,
@@ -151,7 +194,16 @@ Prerequisites (for MCP - Google Calendar/Gmail):
 		help='Detailed output including thinking and actions',
 	)
 
-	return parser.parse_args()
+	return parser
+
+
+def parse_arguments(argv: Optional[list[str]] = None) -> argparse.Namespace:
+	"""Parse command-line arguments
+
+	Args:
+		argv: Arguments to parse (default: sys.argv[1:])
+	"""
+	return _build_parser().parse_args(argv)
 
 
 def validate_model_provider_match(model: str, provider: str, logger: CleanLogger) -> bool:
@@ -159,23 +211,15 @@ def validate_model_provider_match(model: str, provider: str, logger: CleanLogger
 	Validate that model name matches the selected provider
 	Returns True if validation passes, False otherwise (with warnings)
 	"""
-	# Known Groq models that users might confuse with Ollama syntax
-	groq_models = {
-		'gpt-oss-20b': 'openai/gpt-oss-20b',
-		'gpt-oss-120b': 'openai/gpt-oss-120b',
-		'gpt-oss:20b': 'openai/gpt-oss-20b',
-		'gpt-oss:120b': 'openai/gpt-oss-120b',
-	}
-
 	# Check for Groq model with wrong provider
-	if provider == 'ollama' and model in groq_models:
+	if provider == 'ollama' and model in _GROQ_MODELS:
 		logger.warning(f"⚠️  Model '{model}' is a Groq model, not Ollama!")
-		logger.warning(f"   Correct usage: --provider groq --model {groq_models[model]}")
+		logger.warning(f"   Correct usage: --provider groq --model {_GROQ_MODELS[model]}")
 		logger.warning(f"   Continuing anyway, but this will likely fail...")
 		return True  # Let it continue but with warning
 
 	# Check for slash syntax with ollama (common mistake)
-	if provider == 'ollama' and ('/' in model or model.startswith('openai/')):
+	if provider == 'ollama' and '/' in model:
 		logger.warning(f"⚠️  Model '{model}' uses slash syntax which is typically for Groq/OpenAI")
 		logger.warning(f"   Ollama models use colon syntax: model:tag (e.g., 'llama2:7b')")
 		logger.warning(f"   If you meant to use Groq, add: --provider groq")
@@ -190,6 +234,114 @@ def validate_model_provider_match(model: str, provider: str, logger: CleanLogger
 	return True
 
 
+async def _build_openai(args: argparse.Namespace, logger: CleanLogger) -> Tuple[object, int]:
+	"""Create the OpenAI (or an OpenAI-compatible endpoint via OPENAI_BASE_URL) LLM"""
+	from browser_use.llm.openai.chat import ChatOpenAI
+	from openai import DefaultAsyncHttpxClient
+
+	api_key = os.getenv('OPENAI_API_KEY')
+	base_url = os.getenv('OPENAI_BASE_URL')
+
+	# Allow dummy key for vLLM/local endpoints
+	if not api_key and not base_url:
+		logger.error("OPENAI_API_KEY not found in environment")
+		logger.info("Please set it in your .env file or export it:")
+		logger.info("  export OPENAI_API_KEY=your_key_here")
+		logger.info("Or for vLLM/local endpoints, set OPENAI_BASE_URL")
+		return None, 1
+
+	# Use dummy key if base_url is provided (for vLLM compatibility)
+	if base_url and not api_key:
+		api_key = 'dummy'
+
+	# ChatOpenAI builds an SDK client per call; a shared httpx pool keeps connections across them
+	llm = ChatOpenAI(
+		model=args.model,
+		api_key=api_key,
+		base_url=base_url,
+		http_client=DefaultAsyncHttpxClient(),
+	)
+
+	endpoint_info = f" (custom endpoint: {base_url})" if base_url else ""
+	logger.info(f"OpenAI client initialized{endpoint_info}")
+	return llm, 0
+
+
+async def _build_anthropic(args: argparse.Namespace, logger: CleanLogger) -> Tuple[object, int]:
+	"""Create the Anthropic LLM"""
+	from anthropic import AsyncAnthropic
+
+	api_key = os.getenv('ANTHROPIC_API_KEY')
+	if not api_key:
+		logger.error("ANTHROPIC_API_KEY not found in environment")
+		logger.info("Please set it in your .env file or export it:")
+		logger.info("  export ANTHROPIC_API_KEY=your_key_here")
+		return None, 1
+
+	llm = AsyncAnthropic(api_key=api_key)
+	llm.model = args.model
+	logger.info("Anthropic client initialized")
+	return llm, 0
+
+
+async def _build_google(args: argparse.Namespace, logger: CleanLogger) -> Tuple[object, int]:
+	"""Create the Google Gemini LLM"""
+	from browser_use.llm.google import ChatGoogle
+
+	api_key = os.getenv('GOOGLE_API_KEY')
+	if not api_key:
+		logger.error("GOOGLE_API_KEY not found in environment")
+		logger.info("Please set it in your .env file or export it:")
+		logger.info("  export GOOGLE_API_KEY=your_key_here")
+		return None, 1
+
+	llm = ChatGoogle(model=args.model, api_key=api_key)
+	logger.info("Google client initialized")
+	return llm, 0
+
+
+async def _build_ollama(args: argparse.Namespace, logger: CleanLogger) -> Tuple[object, int]:
+	"""Create the Ollama LLM, after checking the server is reachable"""
+	import httpx
+	from browser_use.llm.ollama.chat import ChatOllama
+	from ollama import AsyncClient
+
+	# One pooled client serves the connection test, the main model and the router model
+	client = AsyncClient(
+		host=args.host,
+		timeout=_OLLAMA_TIMEOUT,
+		limits=httpx.Limits(max_keepalive_connections=4),
+	)
+
+	# Test connection first
+	logger.info(f"Testing connection to Ollama at {args.host}...")
+	try:
+		await client.list()
+		logger.info("Connected to Ollama server")
+	except Exception as e:
+		logger.error(f"Failed to connect to Ollama at {args.host}")
+		logger.error(f"Error: {str(e)}")
+		logger.info("\nMake sure Ollama is running:")
+		logger.info("  ollama serve")
+		logger.info(f"\nAnd the model is available:")
+		logger.info(f"  ollama pull {args.model}")
+		await client.close()
+		return None, 1
+
+	llm = ChatOllama(model=args.model, host=args.host, client=client)
+	logger.info(f"Ollama client initialized with model: {args.model}")
+	return llm, 0
+
+
+# Provider name -> async builder returning (llm instance, exit code); each imports its SDK lazily
+_BUILDERS = {
+	'openai': _build_openai,
+	'anthropic': _build_anthropic,
+	'google': _build_google,
+	'ollama': _build_ollama,
+}
+
+
 async def create_llm_from_args(args: argparse.Namespace, logger: CleanLogger) -> Tuple[object, int]:
 	"""
 	Create LLM instance from command-line arguments
@@ -208,89 +360,107 @@ async def create_llm_from_args(args: argparse.Namespace, logger: CleanLogger) ->
 	# Validate model/provider match
 	validate_model_provider_match(args.model, args.provider, logger)
 
+	builder = _BUILDERS.get(args.provider)
+	if builder is None:
+		logger.error(f"Unknown provider: {args.provider}")
+		return None, 1
+
+	return await builder(args, logger)
+
+
+async def close_llm(args: argparse.Namespace, llm) -> None:
+	"""
+	Close the connection pool create_llm_from_args opened for the LLM
+
+	Args:
+		args: Parsed arguments
+		llm: LLM instance returned by create_llm_from_args (may be None)
+	"""
+	if llm is None:
+		return
+
+	if args.provider == 'openai' and llm.http_client is not None:
+		await llm.http_client.aclose()
+	elif args.provider == 'anthropic':
+		await llm.close()
+	elif args.provider == 'ollama' and llm.client is not None:
+		await llm.client.close()
+
+
+async def warm_llm_connection(args: argparse.Namespace, llm) -> None:
+	"""
+	Get the provider ready for the first query while the banner is read
+
+	Hosted providers get their connection opened. For Ollama (already connected
+	by the test in create_llm_from_args) the main and router models are loaded
+	into memory, which otherwise stalls the first query for seconds.
+
+	Args:
+		args: Parsed arguments
+		llm: LLM instance returned by create_llm_from_args
+	"""
+	try:
+		if args.provider == 'openai':
+			await llm.get_client().models.list()
+		elif args.provider == 'anthropic':
+			await llm.models.list(limit=1)
+		elif args.provider == 'ollama':
+			# An empty prompt makes Ollama load the model without generating anything
+			for model in dict.fromkeys((args.router_model or args.model, args.model)):
+				await llm.client.generate(model=model, prompt='')
+	except Exception:
+		# Best effort; the first query simply opens its own connection
+		pass
+
+
+def create_router_llm(args: argparse.Namespace, llm, logger: CleanLogger):
+	"""
+	Create the LLM used for tool routing
+
+	Routing is a small classification task, so a lighter model from the same
+	provider answers it faster and cheaper than the main model.
+
+	Args:
+		args: Parsed arguments
+		llm: Main LLM instance (reused when no router model is given)
+		logger: Logger for output
+
+	Returns:
+		Router LLM instance
+	"""
+	if not args.router_model or args.router_model == args.model:
+		return llm
+
 	if args.provider == 'openai':
 		from browser_use.llm.openai.chat import ChatOpenAI
 
-		api_key = os.getenv('OPENAI_API_KEY')
-		base_url = os.getenv('OPENAI_BASE_URL')
-
-		# Allow dummy key for vLLM/local endpoints
-		if not api_key and not base_url:
-			logger.error("OPENAI_API_KEY not found in environment")
-			logger.info("Please set it in your .env file or export it:")
-			logger.info("  export OPENAI_API_KEY=your_key_here")
-			logger.info("Or for vLLM/local endpoints, set OPENAI_BASE_URL")
-			return None, 1
-
-		# Use dummy key if base_url is provided (for vLLM compatibility)
-		if base_url and not api_key:
-			api_key = 'dummy'
-
-		llm = ChatOpenAI(
-			model=args.model,
-			api_key=api_key,
-			base_url=base_url
+		router_llm = ChatOpenAI(
+			model=args.router_model,
+			api_key=os.getenv('OPENAI_API_KEY') or 'dummy',
+			base_url=os.getenv('OPENAI_BASE_URL'),
+			http_client=llm.http_client,
 		)
 
-		endpoint_info = f" (custom endpoint: {base_url})" if base_url else ""
-		logger.info(f"OpenAI client initialized{endpoint_info}")
-		return llm, 0
-
 	elif args.provider == 'anthropic':
-		from anthropic import AsyncAnthropic
+		from browser_use.llm.anthropic.chat import ChatAnthropic
 
-		api_key = os.getenv('ANTHROPIC_API_KEY')
-		if not api_key:
-			logger.error("ANTHROPIC_API_KEY not found in environment")
-			logger.info("Please set it in your .env file or export it:")
-			logger.info("  export ANTHROPIC_API_KEY=your_key_here")
-			return None, 1
-
-		llm = AsyncAnthropic(api_key=api_key)
-		llm.model = args.model
-		logger.info("Anthropic client initialized")
-		return llm, 0
+		router_llm = ChatAnthropic(model=args.router_model, api_key=os.getenv('ANTHROPIC_API_KEY'))
 
 	elif args.provider == 'google':
 		from browser_use.llm.google import ChatGoogle
 
-		api_key = os.getenv('GOOGLE_API_KEY')
-		if not api_key:
-			logger.error("GOOGLE_API_KEY not found in environment")
-			logger.info("Please set it in your .env file or export it:")
-			logger.info("  export GOOGLE_API_KEY=your_key_here")
-			return None, 1
-
-		llm = ChatGoogle(model=args.model, api_key=api_key)
-		logger.info("Google client initialized")
-		return llm, 0
+		router_llm = ChatGoogle(model=args.router_model, api_key=os.getenv('GOOGLE_API_KEY'))
 
 	elif args.provider == 'ollama':
 		from browser_use.llm.ollama.chat import ChatOllama
-		from ollama import AsyncClient
-
-		# Test connection first
-		logger.info(f"Testing connection to Ollama at {args.host}...")
-		try:
-			client = AsyncClient(host=args.host)
-			await client.list()
-			logger.info("Connected to Ollama server")
-		except Exception as e:
-			logger.error(f"Failed to connect to Ollama at {args.host}")
-			logger.error(f"Error: {str(e)}")
-			logger.info("\nMake sure Ollama is running:")
-			logger.info("  ollama serve")
-			logger.info(f"\nAnd the model is available:")
-			logger.info(f"  ollama pull {args.model}")
-			return None, 1
-
-		llm = ChatOllama(model=args.model, host=args.host)
-		logger.info(f"Ollama client initialized with model: {args.model}")
-		return llm, 0
+
+		router_llm = ChatOllama(model=args.router_model, host=args.host, client=llm.client)
 
 	else:
-		logger.error(f"Unknown provider: {args.provider}")
-		return None, 1
+		return llm
+
+	logger.info(f"Router model: {args.router_model}")
+	return router_llm
 
 
 def setup_mcp_environment(args: argparse.Namespace):
@@ -305,13 +475,6 @@ def setup_mcp_environment(args: argparse.Namespace):
 		if args.google_credentials:
 			os.environ['GOOGLE_CREDENTIALS_PATH'] = args.google_credentials
 
-		# Use default token paths if not already set
-		if 'GOOGLE_TOKEN_PATH' not in os.environ:
-			os.environ['GOOGLE_TOKEN_PATH'] = 'token.pickle'
-
-		# Set MCP server ports if not already set
-		if 'MCP_CALENDAR_PORT' not in os.environ:
-			os.environ['MCP_CALENDAR_PORT'] = '8002'
-
-		if 'MCP_GMAIL_PORT' not in os.environ:
-			os.environ['MCP_GMAIL_PORT'] = '8001'
+		# Token path and server ports, unless already set
+		for name, value in _MCP_ENV_DEFAULTS:
+			os.environ.setdefault(name, value)
@@ -3,11 +3,65 @@ Command Handler Module
 Handles special commands in the REPL (commands starting with /)
 """
 
-from typing import Optional, TYPE_CHECKING
+import sys
+from functools import partial
+from typing import Awaitable, Callable, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
 	from repl.session_manager import SessionManager
 
+_SEP = "=" * 60
+
+# Servers /connect accepts
+_VALID_MCP_SERVERS = frozenset({'calendar', 'gmail'})
+
+# Static /help body, built once at import and written in one call
+_HELP_TEXT = "\n".join([
+	"",
+	_SEP,
+	"Browser-Use REPL - Available Commands",
+	_SEP,
+	"\n📋 Basic Commands:",
+	"  /help     - Show this help message",
+	"  /exit     - Exit the REPL",
+	"  /quit     - Exit the REPL",
+	"  /clear    - Clear browser session and start fresh",
+	"  /history  - Show command history",
+	"  /config   - Show current configuration",
+	"\n🎯 Tool Forcing (override automatic routing):",
+	"  /browser <query>         - Force use of browser tool",
+	"  /calendar <query>        - Force use of calendar tool",
+	"  /calender <query>        - Alias for /calendar",
+	"  /email <query>           - Force use of email/Gmail tool",
+	"  /mail <query>            - Alias for /email",
+	"  /sheets <query>          - Force use of Google Sheets tool",
+	"  /sheet <query>           - Alias for /sheets",
+	"  /chat <message>          - Force pure chat response",
+	"\n🔌 MCP Server Management:",
+	"  /connect <server>    - Connect to MCP server (calendar, gmail, sheets)",
+	"  /disconnect <server> - Disconnect from MCP server",
+	"  /status              - Show MCP connection status",
+	"  /tools               - List available tools",
+	"\n💡 Tips:",
+	"  - Just type naturally - the AI will choose the right tool automatically",
+	"  - Calendar, email, and sheets tools auto-connect on first use",
+	"  - Use /browser, /mail, /calendar, /sheets, /chat to force specific tools",
+	"  - Example: '/browser remember to meet dentist at 6pm' forces browser use",
+	"\n🌐 Using Existing Chrome:",
+	"  - Auto-connects to Chrome on port 9222 if available",
+	"  - Launch Chrome with:",
+	"    google-chrome --remote-debugging-port=9222 --user-data-dir=/tmp/chrome-debug",
+	"  - Verify with: curl http://localhost:9222/json/version",
+	"  - Or specify custom port: python browser_use_repl.py --cdp-url http://localhost:PORT",
+	_SEP + "\n\n",
+])
+
+
+def _normalize_server(server_type: str) -> str:
+	"""Strip a server name and lowercase it unless it already is"""
+	server_type = server_type.strip()
+	return server_type if server_type.islower() else server_type.lower()
+
 
 class CommandHandler:
 	"""Handles REPL special commands"""
@@ -23,199 +77,177 @@ class CommandHandler:
 		self.session = session
 		self.logger = logger
 
-	async def handle_command(self, command_str: str) -> bool:
+		# Command name -> handler(args) returning False to exit the REPL.
+		# Display commands run without a coroutine; only commands that do I/O are async.
+		self._sync_commands: dict[str, Callable[[str], bool]] = {
+			'exit': self._exit,
+			'quit': self._exit,
+			'help': self._help,
+			'history': self._history,
+			'config': self._config,
+			'status': self._status,
+			'tools': self._tools,
+		}
+		browser = partial(self._run_forced, 'browser', "Usage: /browser <query>")
+		calendar = partial(self._run_forced, 'calendar', "Usage: /calendar <query>")
+		email = partial(self._run_forced, 'email', "Usage: /email or /mail <query>")
+		sheets = partial(self._run_forced, 'sheets', "Usage: /sheets or /sheet <query>")
+		self._async_commands: dict[str, Callable[[str], Awaitable[bool]]] = {
+			'clear': self._clear,
+			# Tool forcing, with common misspellings and short aliases
+			'browser': browser,
+			'calendar': calendar,
+			'calender': calendar,
+			'email': email,
+			'mail': email,
+			'sheets': sheets,
+			'sheet': sheets,
+			'chat': partial(self._run_forced, 'chat', "Usage: /chat <message>"),
+			# MCP management
+			'connect': self._connect,
+			'disconnect': self._disconnect,
+		}
+
+	@staticmethod
+	def parse_command(command_str: str) -> tuple[str, str]:
+		"""Split a command string (without the leading /) into lowercased name and arguments"""
+		command, _, args = command_str.strip().partition(' ')
+		# Interned, so the dispatch tables' literal keys match by identity without a string compare
+		return sys.intern(command.lower()), args.strip()
+
+	def try_handle_sync(self, command: str, args: str) -> Optional[bool]:
 		"""
-		Handle a special command
-
-		Args:
-			command_str: Command string (without the leading /)
+		Handle a command that needs no I/O
 
 		Returns:
-			True if command was handled, False if should exit REPL
+			True/False as handle_async, or None if the command must go through handle_async
 		"""
-		# Parse command and arguments
-		parts = command_str.lower().split(maxsplit=1)
-		command = parts[0]
-		args = parts[1] if len(parts) > 1 else ""
-
-		# Exit commands
-		if command in ['exit', 'quit']:
-			self.logger.info("Exiting REPL...")
-			return False
-
-		# Help command
-		elif command == 'help':
-			self._show_help()
-			return True
-
-		# Clear session
-		elif command == 'clear':
-			await self.session.clear_session()
-			return True
+		handler = self._sync_commands.get(command)
+		if handler is None:
+			return None
+		return handler(args)
 
-		# Show history
-		elif command == 'history':
-			self._show_history()
-			return True
-
-		# Show config
-		elif command == 'config':
-			self._show_config()
-			return True
+	async def handle_async(self, command: str, args: str) -> bool:
+		"""
+		Handle a command that awaits the session (or an unknown command)
 
-		# Tool forcing commands (new)
-		elif command == 'browser':
-			if not args:
-				self.logger.error("Usage: /browser <query>")
-				return True
-			self.session.force_tool = 'browser'
-			await self.session.process_query(args)
-			self.session.force_tool = None
+		Returns:
+			True if command was handled, False if should exit REPL
+		"""
+		handler = self._async_commands.get(command)
+		if handler is None:
+			self.logger.error(f"Unknown command: /{command}")
+			self.logger.info("Type /help to see available commands")
 			return True
+		return await handler(args)
 
-		elif command in ['calendar', 'calender']:  # Support common misspelling
-			if not args:
-				self.logger.error("Usage: /calendar <query>")
-				return True
-			self.session.force_tool = 'calendar'
-			await self.session.process_query(args)
-			self.session.force_tool = None
-			return True
+	async def handle_command(self, command_str: str) -> bool:
+		"""
+		Handle a special command
 
-		elif command in ['email', 'mail']:  # Support shorter alias
-			if not args:
-				self.logger.error("Usage: /email or /mail <query>")
-				return True
-			self.session.force_tool = 'email'
-			await self.session.process_query(args)
-			self.session.force_tool = None
-			return True
+		Args:
+			command_str: Command string (without the leading /)
 
-		elif command in ['sheets', 'sheet']:  # Support shorter alias
-			if not args:
-				self.logger.error("Usage: /sheets or /sheet <query>")
-				return True
-			self.session.force_tool = 'sheets'
-			await self.session.process_query(args)
-			self.session.force_tool = None
+		Returns:
+			True if command was handled, False if should exit REPL
+		"""
+		command, args = self.parse_command(command_str)
+		handled = self.try_handle_sync(command, args)
+		if handled is None:
+			handled = await self.handle_async(command, args)
+		return handled
+
+	def _exit(self, args: str) -> bool:
+		"""/exit, /quit"""
+		self.logger.info("Exiting REPL...")
+		return False
+
+	def _help(self, args: str) -> bool:
+		"""/help"""
+		self._show_help()
+		return True
+
+	def _history(self, args: str) -> bool:
+		"""/history"""
+		self._show_history()
+		return True
+
+	def _config(self, args: str) -> bool:
+		"""/config"""
+		self._show_config()
+		return True
+
+	def _status(self, args: str) -> bool:
+		"""/status"""
+		self._show_status()
+		return True
+
+	def _tools(self, args: str) -> bool:
+		"""/tools"""
+		self._show_tools()
+		return True
+
+	async def _clear(self, args: str) -> bool:
+		"""/clear"""
+		await self.session.clear_session()
+		return True
+
+	async def _run_forced(self, tool: str, usage: str, args: str) -> bool:
+		"""Run args as a query on one tool, bypassing routing"""
+		if not args:
+			self.logger.error(usage)
 			return True
-
-		elif command == 'chat':
-			if not args:
-				self.logger.error("Usage: /chat <message>")
-				return True
-			self.session.force_tool = 'chat'
+		self.session.force_tool = tool
+		try:
 			await self.session.process_query(args)
+		finally:
 			self.session.force_tool = None
-			return True
+		return True
 
-		# MCP management commands (new)
-		elif command == 'connect':
-			if not args:
-				self.logger.error("Usage: /connect <calendar|gmail|sheets>")
-				return True
-			await self._connect_mcp(args)
+	async def _connect(self, args: str) -> bool:
+		"""/connect <server>"""
+		if not args:
+			self.logger.error("Usage: /connect <calendar|gmail|sheets>")
 			return True
+		await self._connect_mcp(args)
+		return True
 
-		elif command == 'disconnect':
-			if not args:
-				self.logger.error("Usage: /disconnect <calendar|gmail|sheets>")
-				return True
-			await self._disconnect_mcp(args)
-			return True
-
-		elif command == 'status':
-			self._show_status()
-			return True
-
-		elif command == 'tools':
-			self._show_tools()
-			return True
-
-		# Unknown command
-		else:
-			self.logger.error(f"Unknown command: /{command}")
-			self.logger.info("Type /help to see available commands")
+	async def _disconnect(self, args: str) -> bool:
+		"""/disconnect <server>"""
+		if not args:
+			self.logger.error("Usage: /disconnect <calendar|gmail|sheets>")
 			return True
+		await self._disconnect_mcp(args)
+		return True
 
 	def _show_help(self):
 		"""Display help message"""
-		print("\n" + "="*60)
-		print("Browser-Use REPL - Available Commands")
-		print("="*60)
-
-		print("\n📋 Basic Commands:")
-		print("  /help     - Show this help message")
-		print("  /exit     - Exit the REPL")
-		print("  /quit     - Exit the REPL")
-		print("  /clear    - Clear browser session and start fresh")
-		print("  /history  - Show command history")
-		print("  /config   - Show current configuration")
-
-		print("\n🎯 Tool Forcing (override automatic routing):")
-		print("  /browser <query>         - Force use of browser tool")
-		print("  /calendar <query>        - Force use of calendar tool")
-		print("  /calender <query>        - Alias for /calendar")
-		print("  /email <query>           - Force use of email/Gmail tool")
-		print("  /mail <query>            - Alias for /email")
-		print("  /sheets <query>          - Force use of Google Sheets tool")
-		print("  /sheet <query>           - Alias for /sheets")
-		print("  /chat <message>          - Force pure chat response")
-
-		print("\n🔌 MCP Server Management:")
-		print("  /connect <server>    - Connect to MCP server (calendar, gmail, sheets)")
-		print("  /disconnect <server> - Disconnect from MCP server")
-		print("  /status              - Show MCP connection status")
-		print("  /tools               - List available tools")
-
-		print("\n💡 Tips:")
-		print("  - Just type naturally - the AI will choose the right tool automatically")
-		print("  - Calendar, email, and sheets tools auto-connect on first use")
-		print("  - Use /browser, /mail, /calendar, /sheets, /chat to force specific tools")
-		print("  - Example: '/browser remember to meet dentist at 6pm' forces browser use")
-
-		print("\n🌐 Using Existing Chrome:")
-		print("  - Auto-connects to Chrome on port 9222 if available")
-		print("  - Launch Chrome with:")
-		print("    google-chrome --remote-debugging-port=9222 --user-data-dir=/tmp/chrome-debug")
-		print("  - Verify with: curl http://localhost:9222/json/version")
-		print("  - Or specify custom port: python browser_use_repl.py --cdp-url http://localhost:PORT")
-
-		print("="*60 + "\n")
+		sys.stdout.write(_HELP_TEXT)
 
 	def _show_history(self):
 		"""Display command history"""
-		print("\nCommand History:")
 		if not self.session.command_history:
-			print("  (empty)")
-		else:
-			for i, cmd in enumerate(self.session.command_history, 1):
-				print(f"  {i}. {cmd}")
+			sys.stdout.write("\nCommand History:\n  (empty)\n")
+			return
+		lines = ["\nCommand History:"]
+		lines.extend(f"  {i}. {cmd}" for i, cmd in enumerate(self.session.command_history, 1))
+		lines.append("")
+		sys.stdout.write("\n".join(lines))
 
 	def _show_config(self):
 		"""Display current configuration"""
-		print("\nCurrent Configuration:")
-		print(f"  LLM: {self.session.llm.__class__.__name__}")
-		if hasattr(self.session.llm, 'model'):
-			print(f"  Model: {self.session.llm.model}")
-		print(f"  Browser Mode: {'Headless' if self.session.headless else 'Visible'}")
-		print(f"  Vision: {'Enabled' if self.session.use_vision else 'Disabled'}")
-		print(f"  Max Steps: {self.session.max_steps}")
-		print(f"  Prompt Optimization: {'Enabled' if self.session.optimize_prompts else 'Disabled'}")
-		print(f"  MCP Enabled: {'Yes' if self.session.enable_mcp else 'No'}")
-		print(f"  Pure Chat Mode: {'Disabled' if self.session.disable_chat else 'Enabled'}")
+		sys.stdout.write(self.session.config_summary)
 
 	async def _connect_mcp(self, server_type: str):
 		"""Connect to an MCP server"""
-		server_type = server_type.strip().lower()
+		server_type = _normalize_server(server_type)
 
 		if not self.session.enable_mcp:
 			self.logger.error("MCP is disabled. Restart REPL with MCP enabled.")
 			return
 
-		valid_servers = ['calendar', 'gmail']
-		if server_type not in valid_servers:
-			self.logger.error(f"Unknown server: {server_type}. Valid: {', '.join(valid_servers)}")
+		if server_type not in _VALID_MCP_SERVERS:
+			self.logger.error(f"Unknown server: {server_type}. Valid: {', '.join(sorted(_VALID_MCP_SERVERS))}")
 			return
 
 		try:
@@ -226,7 +258,7 @@ class CommandHandler:
 
 	async def _disconnect_mcp(self, server_type: str):
 		"""Disconnect from an MCP server"""
-		server_type = server_type.strip().lower()
+		server_type = _normalize_server(server_type)
 
 		if not self.session.enable_mcp or not self.session.mcp_manager:
 			self.logger.error("MCP is disabled")
@@ -241,65 +273,60 @@ class CommandHandler:
 
 	def _show_status(self):
 		"""Show MCP connection status"""
-		print("\n" + "="*60)
-		print("MCP Server Status")
-		print("="*60)
+		lines = ["", _SEP, "MCP Server Status", _SEP]
 
 		if not self.session.enable_mcp:
-			print("MCP is disabled")
-			print("="*60 + "\n")
+			lines += ["MCP is disabled", _SEP + "\n"]
+			print("\n".join(lines))
 			return
 
-		print(f"\nMCP Manager: {'Initialized' if self.session.mcp_manager else 'Not initialized'}")
+		lines.append(f"\nMCP Manager: {'Initialized' if self.session.mcp_manager else 'Not initialized'}")
 
 		if self.session.mcp_manager:
 			connected = self.session.mcp_manager.get_connected_servers()
+			connected_set = set(connected)
 			available = self.session.mcp_manager.get_available_servers()
 
-			print(f"\nConnected Servers ({len(connected)}):")
+			lines.append(f"\nConnected Servers ({len(connected)}):")
 			if connected:
-				for server in connected:
-					print(f"  ✅ {server}")
+				lines.extend(f"  ✅ {server}" for server in connected)
 			else:
-				print("  (none)")
+				lines.append("  (none)")
 
-			print(f"\nAvailable Servers ({len(available)}):")
+			lines.append(f"\nAvailable Servers ({len(available)}):")
 			for server in available:
-				status = "✅ connected" if server in connected else "⚪ disconnected"
-				print(f"  {status} - {server}")
+				status = "✅ connected" if server in connected_set else "⚪ disconnected"
+				lines.append(f"  {status} - {server}")
 
-		print("="*60 + "\n")
+		lines.append(_SEP + "\n")
+		print("\n".join(lines))
 
 	def _show_tools(self):
 		"""Show available tools"""
-		print("\n" + "="*60)
-		print("Available Tools")
-		print("="*60)
-
-		print("\n🌐 Browser Tool:")
-		print("  - Always available")
-		print("  - Web browsing, searching, data extraction")
-
-		print("\n💬 Chat Tool:")
-		print(f"  - {'Disabled' if self.session.disable_chat else 'Enabled'}")
-		print("  - Pure conversation without external tools")
+		lines = [
+			"", _SEP, "Available Tools", _SEP,
+			"\n🌐 Browser Tool:",
+			"  - Always available",
+			"  - Web browsing, searching, data extraction",
+			"\n💬 Chat Tool:",
+			f"  - {'Disabled' if self.session.disable_chat else 'Enabled'}",
+			"  - Pure conversation without external tools",
+		]
 
 		if self.session.enable_mcp:
-			print("\n📅 Calendar Tool (MCP):")
+			lines.append("\n📅 Calendar Tool (MCP):")
 			if 'calendar' in self.session.active_mcp_servers:
-				print("  - ✅ Connected")
-				print("  - List/create/update/delete events, check availability")
+				lines += ["  - ✅ Connected", "  - List/create/update/delete events, check availability"]
 			else:
-				print("  - ⚪ Not connected (will auto-connect on first use)")
+				lines.append("  - ⚪ Not connected (will auto-connect on first use)")
 
-			print("\n📧 Email Tool (MCP):")
+			lines.append("\n📧 Email Tool (MCP):")
 			if 'gmail' in self.session.active_mcp_servers:
-				print("  - ✅ Connected")
-				print("  - List/read/send emails, search, modify labels")
+				lines += ["  - ✅ Connected", "  - List/read/send emails, search, modify labels"]
 			else:
-				print("  - ⚪ Not connected (will auto-connect on first use)")
+				lines.append("  - ⚪ Not connected (will auto-connect on first use)")
 		else:
-			print("\n⚠️  MCP tools disabled")
-			print("  Restart with MCP enabled to use Calendar and Email")
+			lines += ["\n⚠️  MCP tools disabled", "  Restart with MCP enabled to use Calendar and Email"]
 
-		print("="*60 + "\n")
+		lines.append(_SEP + "\n")
+		print("\n".join(lines))
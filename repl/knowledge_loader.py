@@ -3,10 +3,15 @@ Knowledge Loader Module
 Loads personal context from knowledge/ directory text files
 """
 
+import io
 import os
+import re
 from pathlib import Path
 from typing import Dict, Optional
 
+# "name: email" lines in contacts.txt, optionally bulleted with "-"
+_CONTACT_LINE = re.compile(r'^\s*-?\s*(?P<name>[^:\n]+?)\s*:\s*(?P<email>[^\s,]+@[^\s,]+)', re.MULTILINE)
+
 
 class KnowledgeLoader:
 	"""Load and manage personal knowledge/context from text files"""
@@ -21,6 +26,28 @@ class KnowledgeLoader:
 		self.knowledge_dir = Path(knowledge_dir)
 		self.context_cache: Optional[str] = None
 		self.files_cache: Dict[str, str] = {}
+		# Lowercased contact name -> email, parsed from contacts.txt on load
+		self._contact_index: Dict[str, str] = {}
+		# (name, mtime, size) of each .txt file when context_cache was built
+		self._loaded_stamp: frozenset = frozenset()
+		# list_files() result and the directory mtime it was listed at
+		self._file_names: Optional[list[str]] = None
+		self._file_names_mtime_ns: int = 0
+		# get_stats() result for the current context_cache
+		self._stats: Optional[Dict[str, int]] = None
+
+	@staticmethod
+	def _stamp(entries) -> frozenset:
+		"""Cheap validity tag for a set of .txt DirEntry objects (stat only, no reads)"""
+		return frozenset((entry.name, entry.stat().st_mtime_ns, entry.stat().st_size) for entry in entries)
+
+	def _current_stamp(self) -> frozenset:
+		"""Validity tag for the .txt files on disk now, empty if the directory does not exist"""
+		try:
+			with os.scandir(self.knowledge_dir) as it:
+				return self._stamp(entry for entry in it if entry.name.endswith('.txt') and entry.is_file())
+		except OSError:
+			return frozenset()
 
 	def load_all_knowledge(self) -> str:
 		"""
@@ -29,38 +56,55 @@ class KnowledgeLoader:
 		Returns:
 			Combined context string from all knowledge files
 		"""
+		self._stats = None
 		if not self.knowledge_dir.exists():
 			return ""
 
-		knowledge_parts = []
+		# Drop entries for files that have since been removed
+		self.files_cache = {}
 
 		# Load all .txt files
-		txt_files = sorted(self.knowledge_dir.glob("*.txt"))
+		with os.scandir(self.knowledge_dir) as it:
+			txt_files = sorted(
+				(entry for entry in it if entry.name.endswith('.txt') and entry.is_file()),
+				key=lambda entry: entry.name,
+			)
+
+		self._loaded_stamp = self._stamp(txt_files)
 
 		if not txt_files:
 			return ""
 
-		knowledge_parts.append("=== PERSONAL KNOWLEDGE & CONTEXT ===")
-		knowledge_parts.append("")
+		buf = io.StringIO()
+		buf.write("=== PERSONAL KNOWLEDGE & CONTEXT ===\n\n")
 
-		for txt_file in txt_files:
+		for entry in txt_files:
 			try:
-				with open(txt_file, 'r', encoding='utf-8') as f:
-					content = f.read().strip()
-					if content:
-						# Store in cache
-						self.files_cache[txt_file.name] = content
-						# Add to combined knowledge
-						knowledge_parts.append(f"--- {txt_file.stem.upper()} ---")
-						knowledge_parts.append(content)
-						knowledge_parts.append("")
+				# Binary read + one decode skips the text layer's chunked decoding
+				with open(entry.path, 'rb') as f:
+					content = f.read().decode('utf-8').strip()
 			except Exception as e:
-				print(f"Warning: Could not load {txt_file}: {e}")
+				print(f"Warning: Could not load {entry.path}: {e}")
 				continue
+			if '\r' in content:
+				# Universal newlines, as text mode would give
+				content = content.replace('\r\n', '\n').replace('\r', '\n')
+			if content:
+				# Store in cache
+				self.files_cache[entry.name] = content
+				# Add to combined knowledge
+				buf.write(f"--- {entry.name[:-4].upper()} ---\n")
+				buf.write(content)
+				buf.write("\n\n")
+
+		buf.write("=== END KNOWLEDGE ===")
+		self.context_cache = buf.getvalue()
+
+		self._contact_index = {}
+		for match in _CONTACT_LINE.finditer(self.files_cache.get("contacts.txt", "")):
+			# First entry wins, as with the line-by-line search
+			self._contact_index.setdefault(match['name'].lower(), match['email'])
 
-		knowledge_parts.append("=== END KNOWLEDGE ===")
-
-		self.context_cache = "\n".join(knowledge_parts)
 		return self.context_cache
 
 	def get_context(self, force_reload: bool = False) -> str:
@@ -68,12 +112,16 @@ class KnowledgeLoader:
 		Get combined knowledge context
 
 		Args:
-			force_reload: Force reload from disk (default: use cache)
+			force_reload: Force reload from disk (default: use cache unless files changed)
 
 		Returns:
 			Combined context string
 		"""
-		if force_reload or self.context_cache is None:
+		if (
+			force_reload
+			or self.context_cache is None
+			or self._current_stamp() != self._loaded_stamp
+		):
 			return self.load_all_knowledge()
 		return self.context_cache
 
@@ -103,37 +151,42 @@ class KnowledgeLoader:
 		Returns:
 			Email address if found, None otherwise
 		"""
-		contacts_content = self.get_file_content("contacts.txt")
-		if not contacts_content:
-			return None
-
-		# Simple search: look for "name: email" pattern
-		import re
-		pattern = rf'^\s*-?\s*{re.escape(name)}\s*:\s*([^\s,]+@[^\s,]+)'
-		match = re.search(pattern, contacts_content, re.MULTILINE | re.IGNORECASE)
-
-		if match:
-			return match.group(1)
+		# Ensure the index is built
+		if not self.files_cache:
+			self.load_all_knowledge()
 
-		return None
+		return self._contact_index.get(name.strip().lower())
 
 	def has_knowledge(self) -> bool:
 		"""Check if any knowledge files exist"""
-		if not self.knowledge_dir.exists():
-			return False
-		return len(list(self.knowledge_dir.glob("*.txt"))) > 0
+		self._ensure_listing()
+		return bool(self._file_names)
+
+	def _ensure_listing(self) -> None:
+		"""Refresh the sorted .txt listing if the directory's mtime changed (one os.stat otherwise)"""
+		try:
+			mtime_ns = os.stat(self.knowledge_dir).st_mtime_ns
+		except OSError:
+			self._file_names, self._file_names_mtime_ns = [], 0
+			return
+		if self._file_names is not None and mtime_ns == self._file_names_mtime_ns:
+			return
+		with os.scandir(self.knowledge_dir) as it:
+			self._file_names = sorted(entry.name for entry in it if entry.name.endswith('.txt') and entry.is_file())
+		self._file_names_mtime_ns = mtime_ns
 
 	def list_files(self) -> list[str]:
 		"""List all knowledge files"""
-		if not self.knowledge_dir.exists():
-			return []
-		return [f.name for f in sorted(self.knowledge_dir.glob("*.txt"))]
+		self._ensure_listing()
+		return list(self._file_names)
 
 	def get_stats(self) -> Dict[str, int]:
 		"""Get statistics about loaded knowledge"""
 		context = self.get_context()
-		return {
-			"files_count": len(self.files_cache),
-			"total_chars": len(context),
-			"total_lines": len(context.split('\n')) if context else 0,
-		}
+		if self._stats is None:
+			self._stats = {
+				"files_count": len(self.files_cache),
+				"total_chars": len(context),
+				"total_lines": context.count('\n') + 1 if context else 0,
+			}
+		return dict(self._stats)
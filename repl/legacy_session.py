@@ -0,0 +1,710 @@
+"""
+Legacy Interactive Session
+Single-tool REPL that sends every query to one persistent browser agent
+(no tool routing, MCP or chat). Selected with `browser_use_repl.py --legacy`.
+"""
+
+import asyncio
+import functools
+import re
+import sys
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+from browser_use import Agent
+from browser_use.agent.views import AgentSettings
+from browser_use.browser.profile import BrowserProfile
+from browser_use.browser.session import BrowserSession
+
+# Import CleanLogger and related utilities from browser_use_interactive
+from browser_use_interactive import (
+	CleanLogger,
+	LLMCache,
+	collect_stream,
+)
+
+# Official prompting guidelines from https://docs.browser-use.com/customize/agent/prompting-guide
+# Keep this byte-for-byte static and send the user query as a separate, final message:
+# provider prompt caching only reuses an identical prefix
+PROMPT_OPTIMIZATION_SYSTEM_PROMPT = """You are a browser automation prompt optimization expert.
+
+Your task is to convert a user's natural query into an optimized, specific prompt for a browser automation agent.
+
+OFFICIAL PROMPTING GUIDELINES (from browser-use docs):
+
+1. **Be Specific, Not Vague**
+   - Provide detailed, step-by-step instructions
+   - Good: "Go to https://quotes.toscrape.com/, extract the first 3 quotes with authors, save to CSV"
+   - Bad: "Go to web and get some quotes"
+
+2. **Reference Actions by Name**
+   - Use specific action names: navigate, click, scroll, extract, search, input_text, send_keys
+   - Example: "use search action to find tutorials, click to open results, scroll action to view more"
+
+3. **Include Keyboard Navigation for Troubleshooting**
+   - When clicks fail, use keyboard: "send Tab to navigate, Enter to submit"
+   - Example: "If button doesn't click, use send_keys Tab Tab Enter to submit form"
+
+4. **Build Error Recovery Pathways**
+   - Include fallback strategies
+   - Example: "If page blocks access, use google search as alternative. If timeout occurs, use go_back and retry"
+
+5. **Keep It Actionable**
+   - Every instruction should be something the agent can execute
+   - Avoid abstract goals like "understand the page" - instead "extract the main heading text"
+
+The user's message is their query. Generate an optimized prompt following these guidelines.
+Be specific but not overly complex. Focus on clear, actionable steps. Reply with the optimized prompt only."""
+
+# Optimized prompts from earlier sessions, keyed by normalized query and model
+REPL_PROMPT_CACHE_PATH = Path.home() / '.browser_use_repl_cache.json'
+
+# Try to import readline for command history support
+try:
+	import readline
+
+	READLINE_AVAILABLE = True
+except ImportError:
+	READLINE_AVAILABLE = False
+
+# Without readline.append_history_file, rewrite the history file only every this many commands
+_HISTORY_FLUSH_EVERY = 10
+
+
+def resolve_llm_adapter(llm, stream: bool = True) -> Optional[Callable[[str], AsyncIterator[str]]]:
+	"""Pick the optimization call for this LLM's API once, instead of probing it per query
+
+	Args:
+		llm: Language model client
+		stream: Request a token stream from APIs that support one
+
+	Returns:
+		Async generator function yielding the optimized prompt's text deltas for a user query,
+		or None if the API is unknown
+	"""
+	if hasattr(llm, 'chat') and hasattr(llm.chat, 'completions'):
+		# OpenAI-style API (prefix caching is automatic)
+		model = llm.model if hasattr(llm, 'model') else "gpt-4o-mini"
+
+		async def call_openai(user_query: str) -> AsyncIterator[str]:
+			response = await llm.chat.completions.create(
+				model=model,
+				messages=[
+					{"role": "system", "content": PROMPT_OPTIMIZATION_SYSTEM_PROMPT},
+					{"role": "user", "content": user_query},
+				],
+				temperature=0.3,
+				stream=stream,
+			)
+			if not stream:
+				yield response.choices[0].message.content
+				return
+			async for chunk in response:
+				if chunk.choices:
+					yield chunk.choices[0].delta.content
+
+		return call_openai
+
+	if hasattr(llm, 'messages') and hasattr(llm.messages, 'create'):
+		# Anthropic-style API (mark the static block for prompt caching)
+		model = llm.model if hasattr(llm, 'model') else "claude-3-5-sonnet-20241022"
+
+		async def call_anthropic(user_query: str) -> AsyncIterator[str]:
+			response = await llm.messages.create(
+				model=model,
+				max_tokens=1024,
+				system=[{
+					"type": "text",
+					"text": PROMPT_OPTIMIZATION_SYSTEM_PROMPT,
+					"cache_control": {"type": "ephemeral"},
+				}],
+				messages=[{"role": "user", "content": user_query}],
+				temperature=0.3,
+				stream=stream,
+			)
+			if not stream:
+				yield response.content[0].text
+				return
+			async for event in response:
+				if event.type == 'content_block_delta' and event.delta.type == 'text_delta':
+					yield event.delta.text
+
+		return call_anthropic
+
+	if hasattr(llm, 'generate_content_async'):
+		# Google Gemini-style API
+		async def call_gemini(user_query: str) -> AsyncIterator[str]:
+			response = await llm.generate_content_async([PROMPT_OPTIMIZATION_SYSTEM_PROMPT, user_query])
+			yield response.text
+
+		return call_gemini
+
+	if hasattr(llm, 'ainvoke'):
+		# LangChain-style interface (Ollama, etc.); browser_use chat models have no streaming API
+		from browser_use.llm.messages import SystemMessage, UserMessage
+
+		system_message = SystemMessage(content=PROMPT_OPTIMIZATION_SYSTEM_PROMPT, cache=True)
+
+		async def call_ainvoke(user_query: str) -> AsyncIterator[str]:
+			response = await llm.ainvoke([system_message, UserMessage(content=user_query)])
+			if hasattr(response, 'completion'):
+				yield response.completion
+			elif hasattr(response, 'content'):
+				yield response.content
+			else:
+				yield str(response)
+
+		return call_ainvoke
+
+	return None
+
+
+async def optimize_prompt_with_llm(
+	user_query: str,
+	llm,
+	logger: CleanLogger,
+	cache: Optional[LLMCache] = None,
+	call_fn: Optional[Callable[[str], AsyncIterator[str]]] = None,
+) -> str:
+	"""Use LLM to optimize the user query into a specific, actionable prompt (reusing cache hits)
+
+	Args:
+		user_query: User's original query
+		llm: Language model client
+		logger: Logger for output
+		cache: Optional LLMCache of earlier optimizations
+		call_fn: Adapter from resolve_llm_adapter(llm); resolved here if not given
+	"""
+	logger.info(f"\nUser Query: {user_query}")
+
+	# Queries differing only in case or spacing share one cache entry
+	if cache is not None:
+		cache_key = cache.make_key(q=" ".join(user_query.lower().split()), m=getattr(llm, 'model', None))
+		cached_prompt = cache.get(cache_key)
+		if cached_prompt is not None:
+			logger.info(f"\nOptimized Prompt (cached):\n{cached_prompt}\n")
+			return cached_prompt
+
+	logger.info("Generating optimized prompt using LLM...")
+
+	if call_fn is None:
+		call_fn = resolve_llm_adapter(llm, stream=logger.verbose)
+
+	try:
+		if call_fn is not None:
+			# Echo the prompt as it is generated
+			optimized_prompt = await collect_stream(call_fn(user_query), logger)
+		else:
+			# Fallback: try direct call
+			logger.info("Warning: Unknown LLM type, using simple optimization")
+			optimized_prompt = f"{user_query}. Be direct and specific."
+			logger.info(f"\nOptimized Prompt:\n{optimized_prompt}\n")
+
+	except Exception as e:
+		logger.error(f"Prompt optimization failed: {str(e)}")
+		logger.info("Falling back to original query")
+		return user_query
+
+	# Outside the try: failing to persist must not discard a good prompt
+	if cache is not None:
+		await cache.set(cache_key, optimized_prompt)
+	return optimized_prompt
+
+
+# Parameter field names per action params model, computed the first time each model is seen
+@functools.lru_cache(maxsize=64)
+def _param_fields(cls) -> tuple[str, ...]:
+	"""Printable parameter names of an action params model, computed once per class"""
+	return tuple(name for name in getattr(cls, 'model_fields', ()) if name != 'index')
+
+
+def _describe_action(action) -> tuple[str, str]:
+	"""Name and "key=value, ..." parameters of an agent action, skipping the element index"""
+	# Actions are a RootModel union wrapping a model with a single set field: {action_name: params}
+	action = getattr(action, 'root', action)
+	for action_name, params in action.__dict__.items():
+		if params is None:
+			continue
+		parts = [f"{name}={value}" for name in _param_fields(type(params)) if (value := getattr(params, name, None)) is not None]
+		return action_name, ", ".join(parts)
+	return type(action).__name__, ""
+
+
+# Queries starting with these are already direct browser commands
+_DIRECT_COMMAND_PREFIXES = ('click ', 'scroll ', 'navigate ', 'go to ')
+_DIRECT_COMMAND_PREFIX_LEN = max(map(len, _DIRECT_COMMAND_PREFIXES))
+
+# Sentence-ending periods; dots inside domains like amazon.co.uk don't count
+_SENTENCE_END_RE = re.compile(r'\.(?:\s|$)')
+
+
+def _skip_optimization_reason(query: str) -> Optional[str]:
+	"""Why query should run without LLM prompt optimization, or None if it should be optimized"""
+	if len(query.split()) < 6:
+		return "short query"
+	if len(_SENTENCE_END_RE.findall(query)) >= 2:
+		return "already structured"
+	# Only the head can match, so don't lowercase the whole query
+	if query[:_DIRECT_COMMAND_PREFIX_LEN].lower().startswith(_DIRECT_COMMAND_PREFIXES):
+		return "direct browser command"
+	return None
+
+
+@functools.lru_cache(maxsize=32)
+def _focus_suffix(query: str) -> str:
+	"""System prompt suffix that keeps the agent on the user's task"""
+	return f"\n\nIMPORTANT REMINDERS:\n- Your ONLY task is: {query}\n- Do NOT switch to other tasks or examples\n- Stay focused on this specific goal\n- When you complete this task, call the 'done' action immediately\n- Do not continue to other unrelated tasks"
+
+
+async def warm_ollama_prefix(llm) -> None:
+	"""Load the Ollama model and prefill the optimization system prompt so later calls reuse its KV cache
+
+	Args:
+		llm: ChatOllama instance
+	"""
+	try:
+		await llm.get_client().chat(
+			model=llm.model,
+			messages=[{"role": "system", "content": PROMPT_OPTIMIZATION_SYSTEM_PROMPT}],
+			keep_alive='30m',
+			options={'num_predict': 1},
+		)
+	except Exception:
+		# Best effort; the first optimization call simply pays the full prefill
+		pass
+
+
+class InteractiveSession:
+	"""Manages the persistent interactive session with browser agent"""
+
+	def __init__(
+		self,
+		llm,
+		logger: CleanLogger,
+		headless: bool = False,
+		max_steps: int = 20,
+		use_vision: bool = True,
+		optimize_prompts: bool = True,
+		user_data_dir: Optional[str] = None,
+		profile_directory: Optional[str] = None,
+		cdp_url: Optional[str] = None,
+	):
+		self.llm = llm
+		self.logger = logger
+		self.headless = headless
+		self.max_steps = max_steps
+		self.use_vision = use_vision
+		self.optimize_prompts = optimize_prompts
+		self.user_data_dir = user_data_dir
+		self.profile_directory = profile_directory
+		self.cdp_url = cdp_url
+
+		self.browser_session: Optional[BrowserSession] = None
+		self.agent: Optional[Agent] = None
+		self.command_history: list[str] = []
+		self.running = False
+		self.prompt_cache: Optional[LLMCache] = LLMCache(REPL_PROMPT_CACHE_PATH) if optimize_prompts else None
+		self._optimize_call = resolve_llm_adapter(llm, stream=logger.verbose)
+		self._warmup_task: Optional[asyncio.Task] = None
+		self._step_counter = 0
+		self._output_before_step = None
+		# Static agent settings, dumped once; only the system prompt suffix depends on the query.
+		# Dumping AgentSettings (rather than a bare dict) keeps its timeouts, which differ from Agent's defaults.
+		self._base_agent_settings = AgentSettings(
+			use_vision=use_vision,
+			use_thinking=True,
+			max_actions_per_step=10,
+		).model_dump(exclude={'system_prompt_suffix'})
+
+	async def initialize_browser(self):
+		"""Initialize the browser session (called once at startup)"""
+		if self.browser_session is not None:
+			return
+
+		# Warm the local model in the background while the browser starts
+		if self.optimize_prompts and getattr(self.llm, 'provider', None) == 'ollama' and self._warmup_task is None:
+			self._warmup_task = asyncio.create_task(warm_ollama_prefix(self.llm))
+
+		self.logger.header("INITIALIZING BROWSER SESSION")
+		self.logger.info("Starting browser...")
+
+		try:
+			# Configure browser profile with user options
+			browser_profile_args = {
+				'headless': self.headless,
+				'keep_alive': True,  # Keep browser alive between tasks
+				'enable_default_extensions': True,
+				'highlight_elements': True,
+			}
+
+			# Add user data directory if specified
+			if self.user_data_dir:
+				browser_profile_args['user_data_dir'] = self.user_data_dir
+				self.logger.info(f"Using Chrome profile: {self.user_data_dir}")
+
+			# Add profile directory if specified
+			if self.profile_directory:
+				browser_profile_args['profile_directory'] = self.profile_directory
+				self.logger.info(f"Using profile directory: {self.profile_directory}")
+
+			browser_profile = BrowserProfile(**browser_profile_args)
+
+			# Create browser session with CDP URL if specified
+			browser_session_args = {'browser_profile': browser_profile}
+			if self.cdp_url:
+				browser_session_args['cdp_url'] = self.cdp_url
+				self.logger.info(f"Connecting to existing Chrome at: {self.cdp_url}")
+
+			self.browser_session = BrowserSession(**browser_session_args)
+			self.logger.info("Browser initialized successfully")
+
+		except Exception as e:
+			self.logger.error(f"Failed to initialize browser: {str(e)}")
+			raise
+
+	async def _on_step_start(self, agent: Agent) -> None:
+		"""Agent hook: announce the step"""
+		self._step_counter += 1
+		self._output_before_step = agent.state.last_model_output
+		self.logger.step(self._step_counter, "Processing...")
+
+	async def _on_step_end(self, agent: Agent) -> None:
+		"""Agent hook: show the step's reasoning, actions and results"""
+		with self.logger.batched():
+			self._log_step(agent)
+
+	def _log_step(self, agent: Agent) -> None:
+		"""Print the step's reasoning, actions and results"""
+		output = agent.state.last_model_output
+		if output is not None and output is not self._output_before_step:
+			# Show thinking, evaluation and next goal
+			if output.thinking:
+				self.logger.thinking(output.thinking)
+
+			if output.evaluation_previous_goal:
+				self.logger.info(f"\nEvaluation: {output.evaluation_previous_goal}")
+
+			if output.next_goal:
+				self.logger.info(f"Next Goal: {output.next_goal}")
+
+			# Show actions
+			for action in output.action:
+				self.logger.action(*_describe_action(action))
+
+		# Show results
+		for action_result in agent.state.last_result or ():
+			if action_result.extracted_content:
+				self.logger.result(action_result.extracted_content)
+
+			if action_result.error:
+				self.logger.error(action_result.error)
+
+	async def process_query(self, query: str) -> str:
+		"""Process a user query through the browser agent"""
+		# Ensure browser is initialized, overlapping with prompt optimization
+		browser_init = asyncio.create_task(self.initialize_browser()) if self.browser_session is None else None
+
+		# Optimize prompt if enabled and worth an LLM round-trip
+		skip_reason = _skip_optimization_reason(query) if self.optimize_prompts else None
+		if skip_reason:
+			self.logger.info(f"Skipping prompt optimization: {skip_reason}")
+
+		if self.optimize_prompts and not skip_reason:
+			self.logger.header("PROMPT OPTIMIZATION")
+			# Use LLM to optimize the prompt with official guidelines
+			optimized_prompt = await optimize_prompt_with_llm(
+				query, self.llm, self.logger, cache=self.prompt_cache, call_fn=self._optimize_call
+			)
+		else:
+			# Add simple task anchoring to prevent hallucination
+			optimized_prompt = f"""TASK: {query}
+
+IMPORTANT: Focus ONLY on this task. Do not switch to other tasks or examples. Complete this specific goal and nothing else."""
+
+		if browser_init is not None:
+			await browser_init
+
+		# Execute the task
+		self.logger.header("TASK EXECUTION")
+		self.logger.info(f"Task: {optimized_prompt}")
+		self.logger.info(f"Max Steps: {self.max_steps}")
+		self.logger.info(f"Vision: {'Enabled' if self.use_vision else 'Disabled'}")
+		self.logger.info(f"Browser Mode: {'Headless' if self.headless else 'Visible'}")
+
+		try:
+			if self.agent is None:
+				# Create new agent with custom system prompt for better focus
+				self.agent = Agent(
+					task=optimized_prompt,
+					llm=self.llm,
+					browser_session=self.browser_session,
+					**self._base_agent_settings,
+					# Add a custom system prompt suffix to prevent task drift
+					system_prompt_suffix=_focus_suffix(query),
+				)
+			else:
+				# Add new task to existing agent
+				self.agent.add_new_task(optimized_prompt)
+
+			# Step numbering restarts with every task
+			self._step_counter = 0
+			result = await self.agent.run(
+				max_steps=self.max_steps,
+				on_step_start=self._on_step_start,
+				on_step_end=self._on_step_end,
+			)
+
+			# Display final results
+			self.logger.header("EXECUTION COMPLETE")
+
+			if result and hasattr(result, 'final_result'):
+				final_result = result.final_result()
+				if final_result:
+					self.logger.success("Task completed successfully")
+					self.logger.info("\nFinal Result:")
+					self.logger.info(f"{final_result}")
+					return final_result
+				else:
+					self.logger.info("Task completed but no final result returned")
+					return "Task completed"
+			else:
+				self.logger.info("Task completed")
+				return "Task completed"
+
+		except KeyboardInterrupt:
+			self.logger.error("Task interrupted by user")
+			return "Interrupted"
+
+		except Exception as e:
+			self.logger.error(f"Task failed: {e!r}", exc_info=sys.exc_info())
+			return f"Failed: {e}"
+
+	async def clear_session(self):
+		"""Clear the current browser session and agent"""
+		self.logger.info("Clearing browser session...")
+
+		if self.agent:
+			self.agent = None
+
+		if self.browser_session:
+			try:
+				await self.browser_session.close()
+			except Exception as e:
+				self.logger.error(f"Error closing browser: {str(e)}")
+			finally:
+				self.browser_session = None
+
+		self.logger.success("Session cleared")
+
+	async def cleanup(self):
+		"""Cleanup resources on exit"""
+		if self.browser_session:
+			try:
+				await self.browser_session.close()
+			except Exception:
+				pass
+
+
+_COMMAND_LINES = """  /help     - Show this help message
+  /exit     - Exit the REPL
+  /quit     - Exit the REPL
+  /clear    - Clear browser session and start fresh
+  /history  - Show command history
+  /config   - Show current configuration
+"""
+
+_BANNER = f"""
+{'=' * 70}
+  Browser-Use Interactive REPL
+  Chat with the browser agent - Type your queries and press Enter
+{'=' * 70}
+
+Special Commands:
+{_COMMAND_LINES}
+Tips for Better Results:
+  - Be specific and direct in your queries
+  - Example: 'go to youtube.com/@JabezTech and get subscriber count'
+  - Keep queries simple - ONE goal at a time
+  - Use /clear if the agent gets confused or memory changes
+  - Watch the 'Memory:' field - it should match your task
+
+{'=' * 70}
+
+"""
+
+_HELP = f"""
+Available Commands:
+{_COMMAND_LINES}
+Just type your query to interact with the browser agent.
+"""
+
+
+def _write(text: str) -> None:
+	"""Emit a whole block of terminal output with one write and flush"""
+	sys.stdout.write(text)
+	sys.stdout.flush()
+
+
+async def _exit_cmd(session: InteractiveSession, logger: CleanLogger) -> bool:
+	"""/exit, /quit - leave the REPL"""
+	logger.info("Exiting REPL...")
+	return False
+
+
+async def _help_cmd(session: InteractiveSession, logger: CleanLogger) -> bool:
+	"""/help - list commands"""
+	_write(_HELP)
+	return True
+
+
+async def _clear_cmd(session: InteractiveSession, logger: CleanLogger) -> bool:
+	"""/clear - drop the browser session and agent"""
+	await session.clear_session()
+	return True
+
+
+async def _history_cmd(session: InteractiveSession, logger: CleanLogger) -> bool:
+	"""/history - list queries typed this session"""
+	_write("\nCommand History:\n" + "".join(
+		f"  {i}. {cmd}\n" for i, cmd in enumerate(session.command_history, 1)
+	))
+	return True
+
+
+async def _config_cmd(session: InteractiveSession, logger: CleanLogger) -> bool:
+	"""/config - show the session configuration"""
+	llm = session.llm
+	lines = ["\nCurrent Configuration:", f"  LLM: {llm.__class__.__name__}"]
+	if hasattr(llm, 'model'):
+		lines.append(f"  Model: {llm.model}")
+	lines += [
+		f"  Browser Mode: {'Headless' if session.headless else 'Visible'}",
+		f"  Vision: {'Enabled' if session.use_vision else 'Disabled'}",
+		f"  Max Steps: {session.max_steps}",
+		f"  Prompt Optimization: {'Enabled' if session.optimize_prompts else 'Disabled'}",
+	]
+	_write("\n".join(lines) + "\n")
+	return True
+
+
+# Slash commands: handler(session, logger) returns False to leave the REPL
+_COMMANDS: dict[str, Callable[[InteractiveSession, CleanLogger], Awaitable[bool]]] = {
+	'exit': _exit_cmd,
+	'quit': _exit_cmd,
+	'help': _help_cmd,
+	'clear': _clear_cmd,
+	'history': _history_cmd,
+	'config': _config_cmd,
+}
+
+
+async def run_repl(
+	llm,
+	logger: CleanLogger,
+	headless: bool = False,
+	max_steps: int = 20,
+	use_vision: bool = True,
+	optimize_prompts: bool = True,
+	user_data_dir: Optional[str] = None,
+	profile_directory: Optional[str] = None,
+	cdp_url: Optional[str] = None,
+) -> int:
+	"""Run the interactive REPL loop"""
+
+	# Print banner
+	_write(_BANNER)
+
+	# Initialize session
+	session = InteractiveSession(
+		llm=llm,
+		logger=logger,
+		headless=headless,
+		max_steps=max_steps,
+		use_vision=use_vision,
+		optimize_prompts=optimize_prompts,
+		user_data_dir=user_data_dir,
+		profile_directory=profile_directory,
+		cdp_url=cdp_url,
+	)
+
+	# Setup readline history if available
+	if READLINE_AVAILABLE:
+		history_file = Path.home() / '.browser_use_repl_history'
+		try:
+			readline.read_history_file(history_file)
+		except FileNotFoundError:
+			pass
+
+		# Set maximum history length
+		readline.set_history_length(1000)
+
+		# Append each entry instead of rewriting the whole file (append needs the file to exist)
+		can_append = hasattr(readline, 'append_history_file')
+		if can_append:
+			history_file.touch(exist_ok=True)
+		unsaved_entries = 0
+
+	try:
+		while True:
+			try:
+				# Get user input
+				query = input("\n> ").strip()
+
+				if not query:
+					continue
+
+				# Add to history
+				session.command_history.append(query)
+				if READLINE_AVAILABLE:
+					unsaved_entries += 1
+					if can_append:
+						readline.append_history_file(unsaved_entries, history_file)
+						unsaved_entries = 0
+					elif unsaved_entries >= _HISTORY_FLUSH_EVERY:
+						readline.write_history_file(history_file)
+						unsaved_entries = 0
+
+				# Handle special commands
+				if query.startswith('/'):
+					command = query[1:].lower()
+
+					handler = _COMMANDS.get(command)
+					if handler is None:
+						logger.error(f"Unknown command: /{command}")
+						logger.info("Type /help to see available commands")
+						continue
+
+					if not await handler(session, logger):
+						break
+					continue
+
+				# Process the query
+				await session.process_query(query)
+
+			except KeyboardInterrupt:
+				print("\n\nUse /exit or /quit to exit the REPL, or Ctrl+C again to force quit")
+				try:
+					# Wait for confirmation
+					confirm = input("Press Ctrl+C again within 2 seconds to force quit: ")
+				except KeyboardInterrupt:
+					logger.info("\nForce quitting...")
+					break
+				continue
+
+			except EOFError:
+				logger.info("\nExiting REPL...")
+				break
+
+	finally:
+		# Cleanup
+		logger.info("Cleaning up...")
+		if READLINE_AVAILABLE:
+			# Full rewrite once, which also trims the file to the history length
+			try:
+				readline.write_history_file(history_file)
+			except OSError:
+				pass
+		await session.cleanup()
+		logger.success("Goodbye!")
+
+	return 0
@@ -3,6 +3,8 @@ Prompt Optimization Module
 Handles LLM-based prompt optimization for browser automation tasks
 """
 
+from typing import Awaitable, Callable, Optional
+
 from browser_use_interactive import CleanLogger
 from browser_use.llm.messages import UserMessage
 
@@ -41,8 +43,94 @@ Generate an optimized prompt following these guidelines. Be specific but not ove
 
 OPTIMIZED PROMPT:"""
 
+# Split once at the placeholder; joining the halves never interprets braces in the template text
+_OPT_PREFIX, _OPT_SUFFIX = PROMPT_OPTIMIZATION_TEMPLATE.split('{user_query}')
+
+# Decoration around the task in add_task_anchoring; constant, so built once
+_ANCHOR_BAR = "━" * 43
+_ANCHOR_PREFIX = _ANCHOR_BAR + "\nTASK: "
+_ANCHOR_SUFFIX = "\n" + _ANCHOR_BAR + """
+
+⚠️  Your done() message must be a COMPLETE ANSWER with actual data.
+
+❌ NO: "Task completed successfully"
+❌ NO: Just "Donald Trump" with no context
+✅ YES: "I searched for information about the US President. The current president is Donald Trump, who took office in January 2025 for his second term..."
+
+Write a readable answer that includes the actual data you found, not just a status message."""
+
 
-async def optimize_prompt(user_query: str, llm, logger: CleanLogger) -> str:
+def pick_adapter(llm) -> Optional[Callable[[str], Awaitable[str]]]:
+	"""
+	Choose how to send a single prompt to this LLM, once per LLM instance
+
+	Args:
+		llm: Language model instance
+
+	Returns:
+		Coroutine function taking a prompt and returning the stripped reply, or None for unknown LLM types.
+		The OpenAI and Anthropic adapters reuse one messages list, so each adapter must not be awaited
+		concurrently with itself (SessionManager runs one query at a time).
+	"""
+	if hasattr(llm, 'chat') and hasattr(llm.chat, 'completions'):
+		# OpenAI-style API
+		model = llm.model if hasattr(llm, 'model') else "gpt-4o-mini"
+		messages = [{"role": "user", "content": None}]
+
+		async def _openai_call(prompt: str) -> str:
+			messages[0]["content"] = prompt
+			try:
+				response = await llm.chat.completions.create(model=model, messages=messages, temperature=0.3)
+			finally:
+				messages[0]["content"] = None
+			return response.choices[0].message.content.strip()
+
+		return _openai_call
+
+	if hasattr(llm, 'messages') and hasattr(llm.messages, 'create'):
+		# Anthropic-style API
+		model = llm.model if hasattr(llm, 'model') else "claude-3-5-sonnet-20241022"
+		messages = [{"role": "user", "content": None}]
+
+		async def _anthropic_call(prompt: str) -> str:
+			messages[0]["content"] = prompt
+			try:
+				response = await llm.messages.create(model=model, max_tokens=1024, messages=messages, temperature=0.3)
+			finally:
+				messages[0]["content"] = None
+			return response.content[0].text.strip()
+
+		return _anthropic_call
+
+	if hasattr(llm, 'generate_content_async'):
+		# Google Gemini-style API
+		async def _gemini_call(prompt: str) -> str:
+			response = await llm.generate_content_async(prompt)
+			return response.text.strip()
+
+		return _gemini_call
+
+	if hasattr(llm, 'ainvoke'):
+		# LangChain-style interface (Ollama, etc.)
+		async def _langchain_call(prompt: str) -> str:
+			response = await llm.ainvoke([UserMessage(content=prompt)])
+			if hasattr(response, 'completion'):
+				return response.completion.strip()
+			if hasattr(response, 'content'):
+				return response.content.strip()
+			return str(response).strip()
+
+		return _langchain_call
+
+	return None
+
+
+async def optimize_prompt(
+	user_query: str,
+	llm,
+	logger: CleanLogger,
+	adapter: Optional[Callable[[str], Awaitable[str]]] = None,
+) -> str:
 	"""
 	Use LLM to optimize the user query into a specific, actionable prompt
 
@@ -50,6 +138,7 @@ async def optimize_prompt(user_query: str, llm, logger: CleanLogger) -> str:
 		user_query: User's original query
 		llm: Language model instance
 		logger: Logger for output
+		adapter: Result of pick_adapter(llm), to skip probing the LLM type on every call
 
 	Returns:
 		Optimized prompt string
@@ -58,46 +147,14 @@ async def optimize_prompt(user_query: str, llm, logger: CleanLogger) -> str:
 	logger.info("Generating optimized prompt using LLM...")
 
 	# Create the optimization prompt
-	optimization_prompt = PROMPT_OPTIMIZATION_TEMPLATE.format(user_query=user_query)
+	optimization_prompt = _OPT_PREFIX + user_query + _OPT_SUFFIX
 
-	try:
-		# Handle different LLM types
-		if hasattr(llm, 'chat') and hasattr(llm.chat, 'completions'):
-			# OpenAI-style API
-			response = await llm.chat.completions.create(
-				model=llm.model if hasattr(llm, 'model') else "gpt-4o-mini",
-				messages=[{"role": "user", "content": optimization_prompt}],
-				temperature=0.3,
-			)
-			optimized_prompt = response.choices[0].message.content.strip()
-
-		elif hasattr(llm, 'messages') and hasattr(llm.messages, 'create'):
-			# Anthropic-style API
-			response = await llm.messages.create(
-				model=llm.model if hasattr(llm, 'model') else "claude-3-5-sonnet-20241022",
-				max_tokens=1024,
-				messages=[{"role": "user", "content": optimization_prompt}],
-				temperature=0.3,
-			)
-			optimized_prompt = response.content[0].text.strip()
-
-		elif hasattr(llm, 'generate_content_async'):
-			# Google Gemini-style API
-			response = await llm.generate_content_async(optimization_prompt)
-			optimized_prompt = response.text.strip()
-
-		elif hasattr(llm, 'ainvoke'):
-			# LangChain-style interface (Ollama, etc.)
-			messages = [UserMessage(content=optimization_prompt)]
-			response = await llm.ainvoke(messages)
-
-			if hasattr(response, 'completion'):
-				optimized_prompt = response.completion.strip()
-			elif hasattr(response, 'content'):
-				optimized_prompt = response.content.strip()
-			else:
-				optimized_prompt = str(response).strip()
+	if adapter is None:
+		adapter = pick_adapter(llm)
 
+	try:
+		if adapter is not None:
+			optimized_prompt = await adapter(optimization_prompt)
 		else:
 			# Fallback: try direct call
 			logger.info("Warning: Unknown LLM type, using simple optimization")
@@ -123,14 +180,4 @@ def add_task_anchoring(query: str) -> str:
 	Returns:
 		Query with task anchoring added
 	"""
-	return f"""━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-TASK: {query}
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-⚠️  Your done() message must be a COMPLETE ANSWER with actual data.
-
-❌ NO: "Task completed successfully"
-❌ NO: Just "Donald Trump" with no context
-✅ YES: "I searched for information about the US President. The current president is Donald Trump, who took office in January 2025 for his second term..."
-
-Write a readable answer that includes the actual data you found, not just a status message."""
+	return _ANCHOR_PREFIX + query + _ANCHOR_SUFFIX
@@ -6,7 +6,11 @@ Manages browser sessions, agent state, MCP connections, and intelligent tool rou
 import asyncio
 import os
 import re
+import sys
+from collections import deque
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from functools import cached_property, lru_cache
 from typing import Optional, Dict, Any
 
 from browser_use import Agent
@@ -16,16 +20,45 @@ from browser_use.agent.views import AgentSettings
 from browser_use.agent.tool_router import (
 	ToolType,
 	ToolDecision,
+	tool_type_from_str,
 	route_query,
 	parse_manual_override,
 	strip_command_prefix,
 	format_routing_decision_log,
+	load_routing_cache,
+	save_routing_cache,
 )
 from browser_use.mcp.manager import MCPManager
-from browser_use.llm.messages import UserMessage
+from browser_use.llm.messages import SystemMessage, UserMessage
 
-from repl.prompt_optimizer import optimize_prompt, add_task_anchoring
+from repl.prompt_optimizer import optimize_prompt, add_task_anchoring, pick_adapter
 from repl.knowledge_loader import KnowledgeLoader
+from repl._json import loads as json_loads
+
+
+# Routing decisions saved between sessions, so repeated intents skip the routing LLM call
+_ROUTING_CACHE_PATH = Path.home() / '.browser_use_repl_routes.json'
+
+# Queries kept for /history (matches the readline history length)
+_COMMAND_HISTORY_LIMIT = 1000
+
+
+@lru_cache(maxsize=64)
+def _param_fields(cls) -> tuple[str, ...]:
+	"""Printable parameter names of an action params model, computed once per class"""
+	return tuple(name for name in getattr(cls, 'model_fields', ()) if name != 'index')
+
+
+def _describe_action(action) -> tuple[str, str]:
+	"""Name and "key=value, ..." parameters of an agent action, without dumping the model"""
+	# Actions are a RootModel union wrapping a model with a single set field: {action_name: params}
+	action = getattr(action, 'root', action)
+	for action_name, params in action.__dict__.items():
+		if params is None:
+			continue
+		parts = [f"{name}={value}" for name in _param_fields(type(params)) if (value := getattr(params, name, None)) is not None]
+		return action_name, ", ".join(parts)
+	return type(action).__name__, ""
 
 
 class SessionManager:
@@ -52,6 +85,8 @@ class SessionManager:
 		cdp_url: Optional[str] = None,
 		enable_mcp: bool = True,
 		disable_chat: bool = False,
+		router_llm=None,
+		prompt_cache: bool = True,
 	):
 		"""
 		Initialize session manager
@@ -68,23 +103,29 @@ class SessionManager:
 			cdp_url: Connect to existing Chrome via CDP
 			enable_mcp: Enable MCP server support
 			disable_chat: Disable pure chat mode
+			router_llm: Smaller model for tool routing (defaults to llm)
+			prompt_cache: Mark static system prompts cacheable (Anthropic prompt caching)
 		"""
 		self.llm = llm
+		self.router_llm = router_llm or llm
 		self.logger = logger
 		self.headless = headless
 		self.max_steps = max_steps
 		self.use_vision = use_vision
 		self.optimize_prompts = optimize_prompts
+		# How optimize_prompt talks to self.llm, resolved once instead of on every query
+		self._prompt_adapter = pick_adapter(llm)
 		self.user_data_dir = user_data_dir
 		self.profile_directory = profile_directory
 		self.cdp_url = cdp_url
 		self.enable_mcp = enable_mcp
 		self.disable_chat = disable_chat
+		self.prompt_cache = prompt_cache
 
 		# Browser and agent state
 		self.browser_session: Optional[BrowserSession] = None
 		self.agent: Optional[Agent] = None
-		self.command_history: list[str] = []
+		self.command_history: deque[str] = deque(maxlen=_COMMAND_HISTORY_LIMIT)
 		self.running = False
 
 		# MCP integration
@@ -104,6 +145,25 @@ class SessionManager:
 		# Load personal knowledge on startup
 		self._load_personal_knowledge()
 
+		# Reuse routing decisions from earlier sessions
+		load_routing_cache(_ROUTING_CACHE_PATH)
+
+	@cached_property
+	def config_summary(self) -> str:
+		"""/config text; these settings are fixed after __init__, so it is formatted once"""
+		model = f"  Model: {self.llm.model}\n" if hasattr(self.llm, 'model') else ""
+		return (
+			f"\nCurrent Configuration:\n"
+			f"  LLM: {self.llm.__class__.__name__}\n"
+			f"{model}"
+			f"  Browser Mode: {'Headless' if self.headless else 'Visible'}\n"
+			f"  Vision: {'Enabled' if self.use_vision else 'Disabled'}\n"
+			f"  Max Steps: {self.max_steps}\n"
+			f"  Prompt Optimization: {'Enabled' if self.optimize_prompts else 'Disabled'}\n"
+			f"  MCP Enabled: {'Yes' if self.enable_mcp else 'No'}\n"
+			f"  Pure Chat Mode: {'Enabled' if not self.disable_chat else 'Disabled'}\n"
+		)
+
 	def _load_personal_knowledge(self):
 		"""Load personal context from knowledge directory"""
 		if self.knowledge_loader.has_knowledge():
@@ -347,15 +407,16 @@ class SessionManager:
 		if self.personal_context:
 			personal_info = f"\n\n{self.personal_context}\n\nUse this personal information when relevant to answer the user's question."
 
-		# Create chat prompt
-		prompt = f"""You are a helpful AI assistant having a natural conversation.{personal_info}
+		# Static instructions lead so the prompt prefix is identical every turn (provider prefix caching);
+		# the conversation and query, which change each turn, go in the trailing message
+		system_prompt = f"""You are a helpful AI assistant having a natural conversation.{personal_info}
+
+Respond naturally and helpfully."""
 
-Previous conversation:
+		prompt = f"""Previous conversation:
 {context}
 
-User: {query}
-
-Respond naturally and helpfully."""
+User: {query}"""
 
 		try:
 			# Start loading animation
@@ -363,7 +424,10 @@ Respond naturally and helpfully."""
 
 			try:
 				# Use LLM for chat response
-				messages = [UserMessage(content=prompt)]
+				messages = [
+					SystemMessage(content=system_prompt, cache=self.prompt_cache),
+					UserMessage(content=prompt),
+				]
 				response = await self.llm.ainvoke(messages)
 			finally:
 				# Stop loading animation
@@ -459,17 +523,19 @@ Respond naturally and helpfully."""
 		Returns:
 			Task result string
 		"""
-		# Ensure browser is initialized
-		if self.browser_session is None:
-			await self.initialize_browser()
+		# Ensure browser is initialized, overlapping with prompt optimization
+		browser_init = asyncio.create_task(self.initialize_browser()) if self.browser_session is None else None
 
 		# Optimize prompt if enabled
 		if self.optimize_prompts:
 			self.logger.header("PROMPT OPTIMIZATION")
-			optimized_prompt = await optimize_prompt(query, self.llm, self.logger)
+			optimized_prompt = await optimize_prompt(query, self.llm, self.logger, self._prompt_adapter)
 		else:
 			optimized_prompt = add_task_anchoring(query)
 
+		if browser_init is not None:
+			await browser_init
+
 		# Execute the task
 		self.logger.header("TASK EXECUTION")
 		self.logger.info(f"Task: {optimized_prompt}")
@@ -574,11 +640,8 @@ You are a browser automation agent. Navigate websites, extract information, and
 
 		except Exception as e:
 			await self._hide_agent_glow()
-			self.logger.error(f"Task failed: {str(e)}")
-			import traceback
-			if hasattr(self.logger, 'verbose') and self.logger.verbose:
-				traceback.print_exc()
-			return f"Failed: {str(e)}"
+			self.logger.error(f"Task failed: {e!r}", exc_info=sys.exc_info())
+			return f"Failed: {e}"
 
 	def _parse_calendar_query(self, query: str) -> Optional[Dict[str, Any]]:
 		"""
@@ -672,7 +735,7 @@ You are a browser automation agent. Navigate websites, extract information, and
 		Returns:
 			Dict with 'operation' and parameters, or None if LLM fails
 		"""
-		client = self.mcp_manager.clients.get(server_type)
+		client = self.mcp_manager.get_client(server_type)
 		if not client:
 			return None
 
@@ -703,11 +766,9 @@ You are a browser automation agent. Navigate websites, extract information, and
 		current_time_str = now.strftime("%Y-%m-%d %H:%M:%S %Z")
 		timezone_str = now.strftime("%z")  # e.g., +0530 for IST
 
-		prompt = f"""You are an MCP tool selector for {server_type.upper()} operations.
-
-Current date/time: {current_time_str} (timezone: {timezone_str})
-
-User query: "{query}"
+		# Static instructions first so the prompt prefix is identical for every query on this server
+		# (provider prefix caching); the current time and the query come last
+		system_prompt = f"""You are an MCP tool selector for {server_type.upper()} operations.
 
 Available tools:
 {tools_str}
@@ -732,6 +793,9 @@ Respond with ONLY valid JSON (no markdown, no extra text):
 	"reasoning": "why this tool was chosen"
 }}"""
 
+		query_prompt = f'Current date/time: {current_time_str} (timezone: {timezone_str})\n\nUser query: "{query}"'
+		prompt = f"{system_prompt}\n\n{query_prompt}"
+
 		try:
 			# Call LLM with loading animation
 			loading_task = asyncio.create_task(self._show_loading_animation("Analyzing"))
@@ -740,8 +804,10 @@ Respond with ONLY valid JSON (no markdown, no extra text):
 
 				# Try browser_use's message format first
 				try:
-					from browser_use.llm.messages import UserMessage
-					response = await self.llm.ainvoke([UserMessage(content=prompt)])
+					response = await self.llm.ainvoke([
+						SystemMessage(content=system_prompt, cache=self.prompt_cache),
+						UserMessage(content=query_prompt),
+					])
 					if hasattr(response, 'content'):
 						content = response.content.strip()
 					else:
@@ -788,8 +854,7 @@ Respond with ONLY valid JSON (no markdown, no extra text):
 			if not content or len(content.strip()) == 0:
 				raise ValueError("LLM returned empty response")
 
-			import json
-			tool_data = json.loads(content)
+			tool_data = json_loads(content)
 
 			# Map tool names to operations
 			tool_name_map = {
@@ -853,10 +918,8 @@ Respond with ONLY valid JSON (no markdown, no extra text):
 		if self.personal_context:
 			context_section = f"\n\nYour personal information and context:\n{self.personal_context}\n\nUse this information to personalize the email (e.g., your name for signature, your organization, etc.).\n"
 
-		prompt = f"""You are an email writer. Generate a professional email.
-
-RECIPIENT: {recipient}
-MESSAGE: {user_intent}{context_section}
+		# Static instructions (and personal context) first, the per-email details last
+		system_prompt = f"""You are an email writer. Generate a professional email.{context_section}
 
 Respond with ONLY valid JSON, no other text:
 {{
@@ -870,12 +933,16 @@ Rules:
 - Keep it concise (2-3 sentences max)
 - Use personal context (name, signature, etc.) if available"""
 
+		prompt = f"""RECIPIENT: {recipient}
+MESSAGE: {user_intent}"""
+
 		try:
 			# Call LLM to generate email content
-			from browser_use.llm.messages import UserMessage
-
 			print(f"  📝 Writing email...", end='', flush=True)
-			response = await self.llm.ainvoke([UserMessage(content=prompt)])
+			response = await self.llm.ainvoke([
+				SystemMessage(content=system_prompt, cache=self.prompt_cache),
+				UserMessage(content=prompt),
+			])
 			print(f"\r  ✅ Email ready    ", flush=True)
 
 			# Extract clean content from response (same logic as summarization)
@@ -915,8 +982,7 @@ Rules:
 			if not content or len(content.strip()) == 0:
 				raise ValueError("LLM returned empty response")
 
-			import json
-			email_data = json.loads(content)
+			email_data = json_loads(content)
 
 			return {
 				'subject': email_data.get('subject', 'Message from Browser-Use REPL'),
@@ -1269,7 +1335,7 @@ IMPORTANT RULES:
 		Returns:
 			Result string from the MCP tool
 		"""
-		client = self.mcp_manager.clients.get(server_type)
+		client = self.mcp_manager.get_client(server_type)
 		if not client:
 			raise RuntimeError(f"MCP server {server_type} not connected")
 
@@ -1395,12 +1461,12 @@ IMPORTANT RULES:
 			Response string
 		"""
 		# Check for manual tool override
-		manual_tool = parse_manual_override(query) if not self.force_tool else ToolType(self.force_tool)
+		manual_tool = parse_manual_override(query) if not self.force_tool else tool_type_from_str(self.force_tool)
 
 		if manual_tool or self.force_tool:
 			# Strip command prefix if present
 			clean_query = strip_command_prefix(query)
-			tool_type = manual_tool or ToolType(self.force_tool)
+			tool_type = manual_tool or tool_type_from_str(self.force_tool)
 
 			self.logger.info(f"🎯 Manual override: using {tool_type.value.upper()} tool")
 
@@ -1426,7 +1492,7 @@ IMPORTANT RULES:
 		# Automatic tool routing with loading animation
 		loading_task = asyncio.create_task(self._show_loading_animation("Tool Routing"))
 		try:
-			decision = await route_query(self.llm, query, force_tool=manual_tool)
+			decision = await route_query(self.router_llm, query, force_tool=manual_tool)
 		finally:
 			loading_task.cancel()
 			try:
@@ -1481,44 +1547,30 @@ IMPORTANT RULES:
 
 			result = await original_step(*args, **kwargs)
 
-			# Display thinking
-			if result and hasattr(result, 'model_output') and result.model_output:
-				output = result.model_output
-
-				if hasattr(output, 'current_state'):
-					state = output.current_state
+			# Agent.step() returns None; the step's output and results live on the agent state
+			state = self.agent.state
+			output = state.last_model_output
+			if output:
+				if output.thinking:
+					self.logger.thinking(output.thinking)
 
-					if hasattr(state, 'thinking') and state.thinking:
-						self.logger.thinking(state.thinking)
+				if output.evaluation_previous_goal:
+					self.logger.info(f"\nEvaluation: {output.evaluation_previous_goal}")
 
-					if hasattr(state, 'evaluation_previous_goal') and state.evaluation_previous_goal:
-						self.logger.info(f"\nEvaluation: {state.evaluation_previous_goal}")
-
-					if hasattr(state, 'next_goal') and state.next_goal:
-						self.logger.info(f"Next Goal: {state.next_goal}")
+				if output.next_goal:
+					self.logger.info(f"Next Goal: {output.next_goal}")
 
 				# Show actions
-				if hasattr(output, 'actions') and output.actions:
-					for action in output.actions:
-						action_name = action.__class__.__name__ if hasattr(action, '__class__') else str(action)
-
-						params = []
-						if hasattr(action, 'model_dump'):
-							action_dict = action.model_dump()
-							for key, value in action_dict.items():
-								if key not in ['index'] and value is not None:
-									params.append(f"{key}={value}")
-
-						self.logger.action(action_name, ", ".join(params) if params else "")
+				for action in output.action:
+					self.logger.action(*_describe_action(action))
 
 			# Show results
-			if result and hasattr(result, 'result'):
-				for action_result in result.result:
-					if hasattr(action_result, 'extracted_content') and action_result.extracted_content:
-						self.logger.result(action_result.extracted_content)
+			for action_result in state.last_result or ():
+				if action_result.extracted_content:
+					self.logger.result(action_result.extracted_content)
 
-					if hasattr(action_result, 'error') and action_result.error:
-						self.logger.error(action_result.error)
+				if action_result.error:
+					self.logger.error(action_result.error)
 
 			return result
 
@@ -1569,6 +1621,12 @@ IMPORTANT RULES:
 
 	async def cleanup(self):
 		"""Cleanup resources on exit"""
+		# Keep routing decisions for the next session
+		try:
+			await asyncio.to_thread(save_routing_cache, _ROUTING_CACHE_PATH)
+		except OSError:
+			pass
+
 		# Close browser
 		if self.browser_session:
 			try:
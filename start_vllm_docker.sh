@@ -37,6 +37,7 @@ docker run -d \
   --dtype auto \
   --gpu-memory-utilization 0.9 \
   --max-model-len 8192 \
+  --enable-prefix-caching \
   --trust-remote-code
 
 echo ""